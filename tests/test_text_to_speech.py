@@ -0,0 +1,111 @@
+"""Tests for text segmentation in wsws_bulletin.text_to_speech."""
+
+import random
+
+from wsws_bulletin.text_to_speech import iter_bulletin_parts, iter_segments
+
+SENTENCE = "The working class is entering into struggle on an international scale. "
+
+
+def fragments(text, seed=0, max_len=7):
+    """Split text into random small pieces, as a streamed LLM response would be."""
+    rng = random.Random(seed)
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, max_len)
+        yield text[i:i + n]
+        i += n
+
+
+def test_long_text_is_split_into_many_segments():
+    text = SENTENCE * 75  # ~5,300 characters
+
+    segments = list(iter_segments([text], min_chars=400))
+
+    assert len(segments) > 10
+    assert all(len(segment) < 4096 for segment in segments)
+    assert " ".join(segments).split() == text.split()
+
+
+def test_segments_end_at_first_sentence_end_past_min_chars():
+    segments = list(iter_segments([SENTENCE * 10], min_chars=100))
+
+    assert segments[0] == (SENTENCE * 2).strip()
+    assert all(segment.endswith(".") for segment in segments)
+
+
+def test_short_tail_is_merged_into_last_segment():
+    segments = list(iter_segments([SENTENCE * 3 + "Yes."], min_chars=50))
+
+    assert segments[-1].endswith("\nYes.")
+
+
+def test_run_on_text_is_cut_at_max_words():
+    text = " ".join(["word"] * 200)
+
+    segments = list(iter_segments([text], max_words=80))
+
+    assert [len(segment.split()) for segment in segments] == [80, 80, 40]
+
+
+def test_max_words_applies_between_sentence_ends():
+    # Whole paragraphs (as convert_bulletin receives them) of about 150 words
+    paragraph = SENTENCE * 14 + "\n\n"
+
+    segments = list(iter_segments([paragraph * 3], min_chars=50, max_words=80))
+
+    assert all(len(segment.split()) <= 80 for segment in segments)
+    assert all(segment.endswith(".") for segment in segments)
+
+
+def test_max_words_wins_over_min_chars():
+    segments = list(iter_segments([SENTENCE * 20], min_chars=2000, max_words=40))
+
+    assert all(len(segment.split()) <= 40 for segment in segments)
+    assert " ".join(segments).split() == (SENTENCE * 20).split()
+
+
+def test_streamed_fragments_segment_like_whole_text():
+    text = (SENTENCE * 4 + "\n\n") * 5 + " ".join(["run-on"] * 120)
+
+    whole = list(iter_segments([text], min_chars=100, max_words=40))
+    for seed in range(5):
+        assert list(iter_segments(fragments(text, seed), min_chars=100, max_words=40)) == whole
+
+
+BULLETIN = (
+    "=" * 80 + "\n"
+    + "WSWS Daily Bulletin".center(80) + "\n"
+    + "=" * 80 + "\n\n"
+    + "## Executive Summary\n" + SENTENCE * 3 + "\n"
+    + "\n" + "=" * 80 + "\n"
+    + "Generated: 2025-10-14 08:00:00\n\n"
+    + "Source Articles:\n  • Title\n    https://www.wsws.org/en/articles/a.html\n"
+    + "=" * 80
+)
+
+
+def bulletin_parts(pieces):
+    return ["".join(part) for part in iter_bulletin_parts(pieces)]
+
+
+def test_bulletin_is_split_at_rules():
+    parts = bulletin_parts([BULLETIN])
+
+    assert len(parts) == 3
+    assert parts[0].strip() == "WSWS Daily Bulletin"
+    assert parts[1].strip().startswith("## Executive Summary")
+    assert parts[2].strip().startswith("Source Articles:")
+
+
+def test_rules_and_timestamp_are_not_spoken():
+    text = "".join(bulletin_parts([BULLETIN]))
+
+    assert "=" not in text
+    assert "Generated:" not in text
+
+
+def test_streamed_bulletin_parts_match_whole_text():
+    whole = bulletin_parts([BULLETIN])
+    for seed in range(5):
+        assert bulletin_parts(fragments(BULLETIN, seed)) == whole
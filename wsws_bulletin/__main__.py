@@ -1,17 +1,32 @@
 """Command-line interface for WSWS Bulletin."""
 
+import json
 import logging
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import click
 
+from .cache import ResponseCache
 from .config import Config
 from .scraper import WWSSScraper
-from .synthesizer import ArticleSynthesizer
-from .text_to_speech import TextToSpeech, get_available_engines
+
+# The synthesizer and TTS modules pull in heavy SDKs (and torch for Coqui), so
+# they are imported inside the commands that need them
+if TYPE_CHECKING:
+    from .synthesizer import ArticleSynthesizer
+
+# Written to the output directory by `generate --batch-api`, consumed by `poll-batch`
+PENDING_BATCH_FILE = "pending_batch.json"
+
+# Queued to the TTS thread in place of the end-of-text marker when streaming fails
+ABORT_STREAM = object()
 
 
 def setup_logging(verbose: bool = False):
@@ -39,6 +54,214 @@ def cli():
     pass
 
 
+def save_bulletin(bulletin_text: str, output_path: Path, date_str: str) -> Path:
+    """Write the markdown bulletin to the output directory.
+
+    Args:
+        bulletin_text: Complete bulletin text
+        output_path: Output directory
+        date_str: Bulletin date (YYYY-MM-DD) used in the filename
+
+    Returns:
+        Path to the saved markdown file
+    """
+    text_path = output_path / f"bulletin_{date_str}.md"
+
+    with open(text_path, 'w', encoding='utf-8') as f:
+        f.write(bulletin_text)
+
+    click.echo(f"✓ Markdown bulletin saved: {text_path}")
+    click.echo()
+    return text_path
+
+
+def open_response_cache(config: Config) -> Optional[ResponseCache]:
+    """Open the persistent AI response cache, if caching is enabled.
+
+    Args:
+        config: Loaded configuration
+
+    Returns:
+        ResponseCache instance, or None when caching is disabled
+    """
+    if not config.cache_enabled:
+        return None
+    return ResponseCache(expire_after=config.response_cache_expire_hours * 3600)
+
+
+def tts_options(config: Config) -> dict:
+    """Build TextToSpeech keyword arguments from the configuration.
+
+    Args:
+        config: Loaded configuration
+
+    Returns:
+        Keyword arguments for TextToSpeech (other than the cache)
+    """
+    return {
+        "engine": config.tts_engine,
+        "api_key": config.openai_api_key if config.tts_engine == "openai" else None,
+        "max_workers": config.tts_concurrency,
+        "model_name": config.coqui_model if config.tts_engine == "coqui" else config.openai_tts_model,
+        "onnx": config.coqui_onnx,
+        "fp16": config.coqui_fp16,
+        "process": config.coqui_process,
+    }
+
+
+def convert_to_audio(config: Config, bulletin_text: str, output_path: Path) -> str:
+    """Convert the bulletin to audio with the configured TTS engine.
+
+    Args:
+        config: Loaded configuration
+        bulletin_text: Complete bulletin text
+        output_path: Output directory
+
+    Returns:
+        Path to the saved audio file
+    """
+    from .text_to_speech import TextToSpeech
+
+    click.echo(f"Using TTS engine: {config.tts_engine}")
+
+    tts = TextToSpeech(**tts_options(config), cache=open_response_cache(config))
+
+    audio_path = tts.convert_bulletin(
+        bulletin_text,
+        output_dir=str(output_path)
+    )
+
+    click.echo(f"✓ Audio saved: {audio_path}")
+    click.echo()
+    return audio_path
+
+
+def run_in_background(fn, *args, **kwargs) -> Future:
+    """Run a callable on its own background thread.
+
+    The thread is a daemon, so an early exit (no articles, a scrape error)
+    does not wait for a slow task such as a model load to finish.
+
+    Args:
+        fn: Callable to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Future resolving to the callable's result
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name=getattr(fn, "__name__", "background"), daemon=True).start()
+    return future
+
+
+def load_tts_in_background(config: Config, cache: Optional[ResponseCache] = None) -> Future:
+    """Start constructing the TTS engine on a background thread.
+
+    Loading a local model takes seconds, so it is started before scraping and
+    synthesis and collected only when audio is needed.
+
+    Args:
+        config: Loaded configuration
+        cache: Optional persistent cache for synthesized audio
+
+    Returns:
+        Future resolving to the TextToSpeech instance
+    """
+    from .text_to_speech import TextToSpeech
+
+    return run_in_background(TextToSpeech, **tts_options(config), cache=cache)
+
+
+def stream_to_audio(
+    config: Config,
+    synthesizer: "ArticleSynthesizer",
+    content: dict,
+    output_path: Path,
+    tts_future: Future,
+    batched: bool = False
+) -> tuple:
+    """Stream the bulletin from the AI provider into TTS while it is generated.
+
+    Text fragments are handed to a TTS worker thread through a queue, so audio
+    for early sentences is synthesized while the model is still writing.
+
+    Args:
+        config: Loaded configuration
+        synthesizer: Synthesizer for the configured provider
+        content: Scraped content with 'articles' and 'perspective' keys
+        output_path: Output directory
+        tts_future: Future resolving to the TTS engine (see load_tts_in_background)
+        batched: Condense recent articles with one batched call first
+
+    Returns:
+        Tuple of (bulletin text, path to the saved markdown file, audio path)
+    """
+    click.echo(f"Using TTS engine: {config.tts_engine}")
+
+    fragments = queue.Queue()
+    result = {}
+
+    def bulletin_fragments():
+        for piece in iter(fragments.get, None):
+            if piece is ABORT_STREAM:
+                raise RuntimeError("Bulletin generation failed; discarding partial audio")
+            yield piece
+
+    def speak():
+        try:
+            # Fragments queue up while the model finishes loading
+            tts = tts_future.result()
+            result["audio_path"] = tts.convert_bulletin(
+                bulletin_fragments(),
+                output_dir=str(output_path)
+            )
+        except Exception as e:  # re-raised on the main thread below
+            result["error"] = e
+
+    worker = threading.Thread(target=speak, name="tts", daemon=True)
+    worker.start()
+
+    pieces = []
+    try:
+        for piece in synthesizer.stream_bulletin(content, batched=batched):
+            pieces.append(piece)
+            fragments.put(piece)
+    except BaseException as e:
+        # Make the TTS side fail too, rather than save a truncated bulletin
+        fragments.put(ABORT_STREAM)
+        if isinstance(e, Exception):
+            worker.join()
+        raise
+    fragments.put(None)
+
+    bulletin_text = "".join(pieces)
+    click.echo("✓ Synthesis complete")
+    click.echo()
+
+    # Save the text before waiting on audio so it survives a TTS failure
+    text_path = save_bulletin(bulletin_text, output_path, datetime.now().strftime("%Y-%m-%d"))
+
+    worker.join()
+    if "error" in result:
+        raise result["error"]
+
+    click.echo(f"✓ Audio saved: {result['audio_path']}")
+    click.echo()
+    return bulletin_text, text_path, result["audio_path"]
+
+
 @cli.command()
 @click.option(
     "--hours",
@@ -72,6 +295,23 @@ def cli():
     type=click.Path(exists=True),
     help="Path to .env file with configuration"
 )
+@click.option(
+    "--full-text",
+    is_flag=True,
+    help="Fetch the full text of every recent article (default: RSS descriptions, "
+         "full text for the perspective only)"
+)
+@click.option(
+    "--batched",
+    is_flag=True,
+    help="Summarize recent articles in concurrent batched AI calls before synthesis"
+)
+@click.option(
+    "--batch-api",
+    is_flag=True,
+    help="Submit synthesis through the provider Batch API (cheaper, up to 24h); "
+         "collect the result later with 'poll-batch'"
+)
 @click.option(
     "--verbose",
     "-v",
@@ -83,7 +323,10 @@ def cli():
     is_flag=True,
     help="Print the text summary to stdout after generation"
 )
-def generate(hours, output_dir, no_audio, ai_provider, tts_engine, env_file, verbose, print_summary):
+def generate(
+    hours, output_dir, no_audio, ai_provider, tts_engine, env_file, full_text, batched, batch_api,
+    verbose, print_summary
+):
     """Generate a daily bulletin from WSWS articles.
 
     This command:
@@ -119,6 +362,32 @@ def generate(hours, output_dir, no_audio, ai_provider, tts_engine, env_file, ver
     output_path = Path(config.output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Submitting again would overwrite the only record of an already billed batch
+    pending_path = output_path / PENDING_BATCH_FILE
+    if batch_api and pending_path.exists():
+        click.echo(f"✗ A batch is already pending ({pending_path}).", err=True)
+        click.echo("Run 'wsws-bulletin poll-batch' to collect it before submitting another.", err=True)
+        sys.exit(1)
+
+    # Build the AI client (SDK import + setup) while scraping runs
+    from .synthesizer import ArticleSynthesizer
+
+    response_cache = open_response_cache(config)
+    model_name = config.anthropic_model if config.ai_provider == "anthropic" else config.openai_model
+    synth_future = run_in_background(
+        ArticleSynthesizer,
+        provider=config.ai_provider,
+        api_key=config.get_api_key(),
+        model=model_name,
+        cache=response_cache,
+        fallback_model=config.get_fallback_model(),
+        timeout=config.ai_timeout,
+        max_retries=config.ai_max_retries
+    )
+
+    # Load the TTS engine while scraping and synthesis run
+    tts_future = None if no_audio or batch_api else load_tts_in_background(config, response_cache)
+
     click.echo("=" * 60)
     click.echo("WSWS Bulletin Generator".center(60))
     click.echo("=" * 60)
@@ -129,9 +398,10 @@ def generate(hours, output_dir, no_audio, ai_provider, tts_engine, env_file, ver
     click.echo("-" * 60)
     scraper = WWSSScraper(
         cache_enabled=config.cache_enabled,
-        cache_expire_minutes=config.cache_expire_minutes
+        cache_expire_minutes=config.cache_expire_minutes,
+        max_workers=config.fetch_concurrency
     )
-    content = scraper.fetch_all_content(hours=hours)
+    content = scraper.fetch_all_content(hours=hours, fetch_full=full_text)
 
     num_articles = len(content.get('articles', []))
     has_perspective = content.get('perspective') is not None
@@ -148,50 +418,48 @@ def generate(hours, output_dir, no_audio, ai_provider, tts_engine, env_file, ver
     click.echo("Step 2: Synthesizing with AI")
     click.echo("-" * 60)
 
-    # Get model name based on provider
-    model_name = config.anthropic_model if config.ai_provider == "anthropic" else config.openai_model
     click.echo(f"Using provider: {config.ai_provider}")
     click.echo(f"Using model: {model_name}")
 
-    synthesizer = ArticleSynthesizer(
-        provider=config.ai_provider,
-        api_key=config.get_api_key(),
-        model=model_name
-    )
-
-    bulletin_text = synthesizer.generate_bulletin(content)
-    click.echo("✓ Synthesis complete")
-    click.echo()
-
-    # Save markdown bulletin
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    text_filename = f"bulletin_{date_str}.md"
-    text_path = output_path / text_filename
-
-    with open(text_path, 'w', encoding='utf-8') as f:
-        f.write(bulletin_text)
+    synthesizer = synth_future.result()
+
+    if batch_api:
+        if batched:
+            content = synthesizer.condense_content(content)
+        batch_id = synthesizer.submit_batch(content)
+
+        pending = {
+            "batch_id": batch_id,
+            "provider": config.ai_provider,
+            "model": model_name,
+            "submitted_at": datetime.now().isoformat(timespec="seconds"),
+            "content": content,
+        }
+        with open(pending_path, 'w', encoding='utf-8') as f:
+            json.dump(pending, f, ensure_ascii=False, indent=2)
+
+        click.echo(f"✓ Batch submitted: {batch_id}")
+        click.echo(f"✓ Pending batch saved: {pending_path}")
+        click.echo()
+        click.echo("Run 'wsws-bulletin poll-batch' to collect the bulletin once it is ready.")
+        return
 
-    click.echo(f"✓ Markdown bulletin saved: {text_path}")
-    click.echo()
+    if no_audio:
+        bulletin_text = synthesizer.generate_bulletin(content, batched=batched)
+        click.echo("✓ Synthesis complete")
+        click.echo()
 
-    # Step 3: Convert to audio (optional)
-    if not no_audio:
-        click.echo("Step 3: Converting to audio")
+        # Save markdown bulletin
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        text_path = save_bulletin(bulletin_text, output_path, date_str)
+    else:
+        # Step 3 runs alongside step 2: audio is generated as the synthesis streams in
+        click.echo("Step 3: Converting to audio (streaming alongside synthesis)")
         click.echo("-" * 60)
-        click.echo(f"Using TTS engine: {config.tts_engine}")
-
-        tts = TextToSpeech(
-            engine=config.tts_engine,
-            api_key=config.openai_api_key if config.tts_engine == "openai" else None
+        bulletin_text, text_path, _ = stream_to_audio(
+            config, synthesizer, content, output_path, tts_future, batched=batched
         )
-
-        audio_path = tts.convert_bulletin(
-            bulletin_text,
-            output_dir=str(output_path)
-        )
-
-        click.echo(f"✓ Audio saved: {audio_path}")
-        click.echo()
+    text_filename = text_path.name
 
     # Summary
     click.echo("=" * 60)
@@ -209,6 +477,85 @@ def generate(hours, output_dir, no_audio, ai_provider, tts_engine, env_file, ver
         print(bulletin_text)
 
 
+@cli.command()
+@click.option(
+    "--output-dir",
+    default=None,
+    type=click.Path(),
+    help="Directory holding pending_batch.json (default: ./output or from config)"
+)
+@click.option(
+    "--no-audio",
+    is_flag=True,
+    help="Skip audio generation, only create markdown bulletin"
+)
+@click.option(
+    "--env-file",
+    type=click.Path(exists=True),
+    help="Path to .env file with configuration"
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Enable verbose logging (debug mode)"
+)
+def poll_batch(output_dir, no_audio, env_file, verbose):
+    """Collect a bulletin submitted with 'generate --batch-api'."""
+    setup_logging(verbose=verbose)
+
+    config = Config(env_file=env_file)
+    if output_dir:
+        os.environ["OUTPUT_DIR"] = output_dir
+
+    output_path = Path(config.output_dir)
+    pending_path = output_path / PENDING_BATCH_FILE
+    if not pending_path.exists():
+        click.echo(f"No pending batch found at {pending_path}", err=True)
+        sys.exit(1)
+
+    with open(pending_path, encoding='utf-8') as f:
+        pending = json.load(f)
+
+    provider = pending["provider"]
+    api_key = config.anthropic_api_key if provider == "anthropic" else config.openai_api_key
+    if not api_key:
+        click.echo(f"Error: {provider.upper()}_API_KEY not set", err=True)
+        sys.exit(1)
+
+    from .synthesizer import ArticleSynthesizer
+
+    synthesizer = ArticleSynthesizer(provider=provider, api_key=api_key, model=pending["model"])
+
+    click.echo(f"Checking batch {pending['batch_id']} (submitted {pending['submitted_at']})...")
+    try:
+        synthesis = synthesizer.retrieve_batch(pending["batch_id"])
+    except RuntimeError as e:
+        click.echo(f"✗ {e}", err=True)
+        sys.exit(1)
+
+    if synthesis is None:
+        click.echo("Batch is still processing. Try again later.")
+        return
+
+    submitted = datetime.fromisoformat(pending["submitted_at"])
+    bulletin_text = synthesizer.format_bulletin(
+        pending["content"],
+        synthesis,
+        title=f"WSWS Daily Bulletin - {submitted.strftime('%B %d, %Y')}"
+    )
+    click.echo("✓ Synthesis complete")
+    click.echo()
+
+    save_bulletin(bulletin_text, output_path, submitted.strftime("%Y-%m-%d"))
+
+    if not no_audio:
+        convert_to_audio(config, bulletin_text, output_path)
+
+    pending_path.unlink()
+    click.echo("✓ Batch collected")
+
+
 @cli.command()
 @click.option(
     "--verbose",
@@ -251,6 +598,8 @@ def check(verbose):
 
     # Check TTS engines
     click.echo("Available TTS Engines:")
+    from .text_to_speech import get_available_engines
+
     engines = get_available_engines()
     for engine in ["coqui", "openai"]:
         if engine in engines:
@@ -371,7 +720,8 @@ def list_articles(hours, verbose):
     config = Config()
     scraper = WWSSScraper(
         cache_enabled=config.cache_enabled,
-        cache_expire_minutes=config.cache_expire_minutes
+        cache_expire_minutes=config.cache_expire_minutes,
+        max_workers=config.fetch_concurrency
     )
 
     # Get perspective
@@ -0,0 +1,92 @@
+"""Persistent cache for expensive AI responses."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'wsws-bulletin' / 'responses.sqlite'
+
+
+def make_key(*parts) -> str:
+    """Build a stable cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values identifying the cached response (provider, model, content, ...)
+
+    Returns:
+        Hex digest of the canonical JSON encoding of the parts
+    """
+    payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(payload).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed key/value cache shared across runs and threads."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH, expire_after: Optional[int] = 86400):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            expire_after: Entry lifetime in seconds (None to keep entries forever)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.expire_after = expire_after
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+
+        logger.debug(f"Response cache: {self.path}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key (see make_key)
+
+        Returns:
+            Cached bytes, or None on a miss or expired entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        value, expires = row
+        if expires is not None and expires < time.time():
+            return None
+        return bytes(value)
+
+    def set(self, key: str, value: Union[str, bytes]):
+        """Store a value, replacing any existing entry.
+
+        Args:
+            key: Cache key (see make_key)
+            value: Text (stored as UTF-8) or bytes
+        """
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        expires = time.time() + self.expire_after if self.expire_after is not None else None
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                (key, sqlite3.Binary(value), expires)
+            )
@@ -50,6 +50,39 @@ class Config:
         """Get TTS engine (coqui or openai)."""
         return os.getenv("TTS_ENGINE", "coqui").lower()
 
+    @property
+    def coqui_model(self) -> Optional[str]:
+        """Get Coqui TTS model name (None for the engine default)."""
+        return os.getenv("COQUI_MODEL") or None
+
+    @property
+    def openai_tts_model(self) -> Optional[str]:
+        """Get OpenAI TTS model name (None for the engine default)."""
+        return os.getenv("OPENAI_TTS_MODEL") or None
+
+    @property
+    def coqui_onnx(self) -> bool:
+        """Get whether Coqui runs through ONNX Runtime with INT8 weights."""
+        return os.getenv("COQUI_ONNX", "false").lower() in ("true", "1", "yes")
+
+    @property
+    def coqui_fp16(self) -> bool:
+        """Get whether Coqui runs in half precision on a CUDA GPU."""
+        return os.getenv("COQUI_FP16", "false").lower() in ("true", "1", "yes")
+
+    @property
+    def coqui_process(self) -> bool:
+        """Get whether Coqui runs in a separate worker process."""
+        return os.getenv("COQUI_PROCESS", "false").lower() in ("true", "1", "yes")
+
+    @property
+    def tts_concurrency(self) -> int:
+        """Get number of concurrent OpenAI TTS segment requests."""
+        try:
+            return max(1, int(os.getenv("TTS_CONCURRENCY", "4")))
+        except ValueError:
+            return 4
+
     @property
     def cache_enabled(self) -> bool:
         """Get whether HTTP caching is enabled."""
@@ -63,6 +96,22 @@ class Config:
         except ValueError:
             return 30
 
+    @property
+    def response_cache_expire_hours(self) -> int:
+        """Get AI response cache expiration time in hours."""
+        try:
+            return int(os.getenv("RESPONSE_CACHE_EXPIRE_HOURS", "24"))
+        except ValueError:
+            return 24
+
+    @property
+    def fetch_concurrency(self) -> int:
+        """Get maximum number of concurrent article fetches."""
+        try:
+            return max(1, int(os.getenv("WSWS_FETCH_CONCURRENCY", "8")))
+        except ValueError:
+            return 8
+
     @property
     def anthropic_model(self) -> str:
         """Get Anthropic model name."""
@@ -73,6 +122,30 @@ class Config:
         """Get OpenAI model name."""
         return os.getenv("OPENAI_MODEL", "gpt-4o")
 
+    @property
+    def ai_timeout(self) -> float:
+        """Get AI request timeout in seconds."""
+        try:
+            return float(os.getenv("AI_TIMEOUT", "600"))
+        except ValueError:
+            return 600.0
+
+    @property
+    def ai_max_retries(self) -> int:
+        """Get number of retries for failed AI requests."""
+        try:
+            return max(0, int(os.getenv("AI_MAX_RETRIES", "3")))
+        except ValueError:
+            return 3
+
+    def get_fallback_model(self) -> Optional[str]:
+        """Get fallback model for the configured AI provider, if any."""
+        if self.ai_provider == "openai":
+            return os.getenv("OPENAI_FALLBACK_MODEL") or None
+        elif self.ai_provider == "anthropic":
+            return os.getenv("ANTHROPIC_FALLBACK_MODEL") or None
+        return None
+
     def get_api_key(self) -> Optional[str]:
         """Get API key for the configured AI provider."""
         if self.ai_provider == "openai":
@@ -1,34 +1,66 @@
 """Web scraping functionality for WSWS articles."""
 
+import asyncio
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 
 import requests
 import requests_cache
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+
+try:
+    import httpx
+    import h2  # noqa: F401  # required by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# libxml2-backed parser for the RSS feed; entity expansion and network access stay off
+_RSS_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
 
-class WWSSScraper:
-    """Scraper for World Socialist Web Site articles."""
+# Dublin Core author element used by the feed
+_DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
 
-    BASE_URL = "https://www.wsws.org"
-    RSS_FEED_URL = "https://www.wsws.org/en/rss.xml"
+# Perspective articles carry "pers-" at the start of their URL slug
+_PERS_RE = re.compile(r'/pers-')
 
-    def __init__(self, timeout: int = 30, cache_enabled: bool = True, cache_expire_minutes: int = 30):
-        """Initialize the scraper.
 
-        Args:
-            timeout: Request timeout in seconds
-            cache_enabled: Whether to enable HTTP caching (default: True)
-            cache_expire_minutes: Cache expiration time in minutes (default: 30)
-        """
-        self.timeout = timeout
+# Sessions shared by every scraper in the process, keyed by their settings
+_SESSIONS: Dict[Tuple[bool, int, int], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(cache_enabled: bool, cache_expire_minutes: int, pool_size: int) -> requests.Session:
+    """Get the shared HTTP session for the given settings, creating it once.
+
+    Reusing one session lets scrapers in the same process share the open
+    SQLite cache and the pooled keep-alive connections.
+
+    Args:
+        cache_enabled: Whether to enable HTTP caching
+        cache_expire_minutes: Cache expiration time in minutes
+        pool_size: Maximum pooled connections per host
+
+    Returns:
+        Configured requests session
+    """
+    key = (cache_enabled, cache_expire_minutes, pool_size)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is not None:
+            return session
 
         if cache_enabled:
             # Set up cache in a temporary directory
@@ -36,70 +68,302 @@ class WWSSScraper:
             cache_dir.mkdir(parents=True, exist_ok=True)
 
             # Install cache with SQLite backend
-            self.session = requests_cache.CachedSession(
+            session = requests_cache.CachedSession(
                 cache_name=str(cache_dir / 'http_cache'),
                 backend='sqlite',
                 expire_after=cache_expire_minutes * 60,  # Convert to seconds
                 allowable_methods=('GET', 'POST'),
                 allowable_codes=(200, 304),
                 stale_if_error=True,  # Use stale cache if request fails
+                cache_control=True,  # Honor server Cache-Control and revalidate with ETag/Last-Modified
+                check_same_thread=False,  # Articles are fetched from worker threads
             )
             logger.debug(f"HTTP cache enabled: {cache_dir / 'http_cache.sqlite'} (expires after {cache_expire_minutes}min)")
         else:
-            self.session = requests.Session()
+            session = requests.Session()
             logger.debug("HTTP cache disabled")
 
-        self.session.headers.update({
+        # Keep enough pooled keep-alive connections for every worker, and retry
+        # transient server errors with backoff instead of failing the whole run
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
         })
 
-    def get_recent_articles(self, hours: int = 24) -> List[Dict[str, str]]:
-        """Get articles published in the last N hours from RSS feed.
+        _SESSIONS[key] = session
+        return session
+
+
+# Precompiled selectors for article pages, evaluated in C by libxml2
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+_XP_TITLE = etree.XPath('(//h1)[1]')
+_XP_BODY = etree.XPath(f"(//div[{_HAS_CLASS.format('article-content')}])[1]")
+_XP_ARTICLE = etree.XPath('(//article)[1]')
+_XP_SCRIPTS = etree.XPath('.//script | .//style')
+_XP_AUTHOR = etree.XPath(f"(//span[{_HAS_CLASS.format('author')}])[1]")
+_XP_AUTHOR_LINK = etree.XPath("(//a[contains(concat(' ', normalize-space(@rel), ' '), ' author ')])[1]")
+_XP_TIME = etree.XPath('(//time)[1]')
+_XP_DATE = etree.XPath(f"(//span[{_HAS_CLASS.format('date')}])[1]")
+
+
+def _first(tree, *xpaths) -> Optional[etree._Element]:
+    """Return the first element matched by the given XPaths, tried in order."""
+    for xpath in xpaths:
+        matches = xpath(tree)
+        if matches:
+            return matches[0]
+    return None
+
+
+@lru_cache(maxsize=512)
+def _parse_pubdate(value: str) -> datetime:
+    """Parse an RFC 822 pubDate, memoized across feed parses in this process.
+
+    Dates with a "-0000" zone or no zone parse as naive datetimes; they are
+    taken as UTC so they can be compared with the aware cutoff time.
+    """
+    pub_date = parsedate_to_datetime(value)
+    if pub_date.tzinfo is None:
+        pub_date = pub_date.replace(tzinfo=timezone.utc)
+    return pub_date
+
+
+def _summary_content(meta: Dict[str, str]) -> Dict[str, str]:
+    """Build article content from RSS metadata, using the description as text.
+
+    Args:
+        meta: Article metadata from the RSS feed
+
+    Returns:
+        Dictionary with article content (title, text, date, author)
+    """
+    description = meta.get('description') or ''
+    if '<' in description:
+        # Descriptions may carry HTML markup
+        try:
+            description = lxml.html.fragment_fromstring(
+                description, create_parent='div'
+            ).text_content()
+        except etree.ParserError:
+            pass
+
+    return {
+        'title': meta['title'],
+        'text': description.strip(),
+        'author': meta.get('author') or 'Unknown',
+        'date': meta.get('date') or 'Unknown',
+        'url': meta['url']
+    }
+
+
+@lru_cache(maxsize=256)
+def _extract_article(html: bytes, url: str) -> Dict[str, str]:
+    """Extract article fields from a page, memoized on the page URL and body.
+
+    Args:
+        html: Raw HTML of the article page
+        url: Article URL
+
+    Returns:
+        Dictionary with article content (title, text, date, author)
+    """
+    try:
+        tree = lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        tree = None
+    return _extract_from_tree(tree, url)
+
+
+def _extract_from_tree(tree: Optional[etree._Element], url: str) -> Dict[str, str]:
+    """Extract article fields from a parsed page.
+
+    Args:
+        tree: Root element of the parsed page (None if the page was empty)
+        url: Article URL
+
+    Returns:
+        Dictionary with article content (title, text, date, author)
+    """
+    if tree is None:
+        logger.warning(f"Could not parse article page: {url}")
+        tree = lxml.html.document_fromstring('<html></html>')
+
+    # Extract title
+    title_elem = _first(tree, _XP_TITLE)
+    title = title_elem.text_content().strip() if title_elem is not None else "Unknown Title"
+
+    # Extract article text
+    article_body = _first(tree, _XP_BODY, _XP_ARTICLE)
+
+    if article_body is not None:
+        # Remove script and style elements
+        for script in _XP_SCRIPTS(article_body):
+            script.drop_tree()
+
+        # Get text, extracting each paragraph once and skipping empty ones
+        text = '\n\n'.join(
+            filter(None, (p.text_content().strip() for p in article_body.iter('p')))
+        )
+    else:
+        text = ""
+
+    # Extract author
+    author_elem = _first(tree, _XP_AUTHOR, _XP_AUTHOR_LINK)
+    author = author_elem.text_content().strip() if author_elem is not None else "Unknown"
+
+    # Extract date
+    date_elem = _first(tree, _XP_TIME, _XP_DATE)
+    date = date_elem.text_content().strip() if date_elem is not None else "Unknown"
+
+    return {
+        'title': title,
+        'text': text,
+        'author': author,
+        'date': date,
+        'url': url
+    }
+
+
+class WWSSScraper:
+    """Scraper for World Socialist Web Site articles."""
+
+    BASE_URL = "https://www.wsws.org"
+    RSS_FEED_URL = "https://www.wsws.org/en/rss.xml"
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        cache_enabled: bool = True,
+        cache_expire_minutes: int = 30,
+        max_workers: int = 8,
+    ):
+        """Initialize the scraper.
 
         Args:
-            hours: Number of hours to look back (default: 24)
+            timeout: Request timeout in seconds
+            cache_enabled: Whether to enable HTTP caching (default: True)
+            cache_expire_minutes: Cache expiration time in minutes (default: 30)
+            max_workers: Maximum number of concurrent article fetches (default: 8)
+        """
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+
+        self.session = _get_session(cache_enabled, cache_expire_minutes, max(self.max_workers, 10))
+
+        # Without the HTTP cache there is no stored body to reuse, so pages are
+        # parsed straight from the socket instead of being buffered first
+        self.stream_pages = not cache_enabled
+
+        # Without the HTTP cache nothing is lost by bypassing requests, so article
+        # pages can be multiplexed over a single HTTP/2 connection instead
+        self.use_http2 = HTTP2_AVAILABLE and not cache_enabled
+        if self.use_http2:
+            logger.debug("Fetching article pages over HTTP/2")
+
+        # Parsed RSS feed, fetched once per scraper instance
+        self._rss_root = None
+
+    def _get_rss_root(self) -> etree._Element:
+        """Fetch and parse the RSS feed, reusing the result for this scraper.
 
         Returns:
-            List of dictionaries with article metadata (title, url, date, description)
+            Root element of the parsed RSS feed
         """
-        logger.info(f"Fetching recent articles from last {hours} hours...")
-        response = self.session.get(self.RSS_FEED_URL, timeout=self.timeout)
-        response.raise_for_status()
+        if self._rss_root is None:
+            response = self.session.get(self.RSS_FEED_URL, timeout=self.timeout)
+            response.raise_for_status()
+            self._rss_root = etree.fromstring(response.content, parser=_RSS_PARSER)
+        return self._rss_root
+
+    def _parse_feed(self, hours: int = 24) -> Tuple[List[Dict[str, str]], Optional[Dict[str, str]]]:
+        """Collect recent articles and the latest perspective in one pass over the feed.
+
+        Args:
+            hours: Number of hours to look back for recent articles
 
-        # Parse RSS XML
-        root = ET.fromstring(response.content)
+        Returns:
+            Tuple of (recent article metadata list, perspective metadata or None)
+        """
+        root = self._get_rss_root()
         articles = []
+        perspective = None
         cutoff_time = datetime.now().astimezone() - timedelta(hours=hours)
+        is_perspective = _PERS_RE.search
+        parse_date = _parse_pubdate
 
-        # Find all items in the RSS feed
-        for item in root.findall('.//item'):
+        # RSS items are direct children of <channel>; avoid a full descendant walk
+        channel = root.find('channel')
+        items = channel.findall('item') if channel is not None else root.findall('item')
+
+        for item in items:
             title_elem = item.find('title')
             link_elem = item.find('link')
             pubdate_elem = item.find('pubDate')
             description_elem = item.find('description')
+            creator_elem = item.find(_DC_CREATOR)
 
-            if title_elem is None or link_elem is None or pubdate_elem is None:
+            if title_elem is None or link_elem is None:
                 continue
 
             title = title_elem.text
             url = link_elem.text
+            description = description_elem.text if description_elem is not None else ''
+            author = creator_elem.text if creator_elem is not None and creator_elem.text else 'Unknown'
+
+            # Parse RFC 822 date format once; both outputs need it
+            pub_date = None
+            if pubdate_elem is not None:
+                try:
+                    pub_date = parse_date(pubdate_elem.text)
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Could not parse date for article: {title} - {e}")
+
+            date_str = pub_date.strftime('%Y-%m-%d') if pub_date else None
+
+            # The first perspective article (contains "pers-" in URL) is the latest
+            if perspective is None and is_perspective(url):
+                perspective = {
+                    'title': title,
+                    'url': url,
+                    'date': date_str,
+                    'description': description,
+                    'author': author
+                }
 
-            # Parse RFC 822 date format
-            try:
-                pub_date = parsedate_to_datetime(pubdate_elem.text)
-
-                # Only include articles within the time window
-                if pub_date >= cutoff_time:
-                    articles.append({
-                        'title': title,
-                        'url': url,
-                        'date': pub_date.strftime('%Y-%m-%d'),
-                        'description': description_elem.text if description_elem is not None else ''
-                    })
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Could not parse date for article: {title} - {e}")
-                continue
+            # Only include articles within the time window
+            if pub_date is not None and pub_date >= cutoff_time:
+                articles.append({
+                    'title': title,
+                    'url': url,
+                    'date': date_str,
+                    'description': description,
+                    'author': author
+                })
+
+        return articles, perspective
+
+    def get_recent_articles(self, hours: int = 24) -> List[Dict[str, str]]:
+        """Get articles published in the last N hours from RSS feed.
+
+        Args:
+            hours: Number of hours to look back (default: 24)
 
+        Returns:
+            List of dictionaries with article metadata (title, url, date, description)
+        """
+        logger.info(f"Fetching recent articles from last {hours} hours...")
+        articles, _ = self._parse_feed(hours)
         logger.info(f"Found {len(articles)} articles from last {hours} hours")
         return articles
 
@@ -110,47 +374,12 @@ class WWSSScraper:
             Dictionary with perspective metadata (title, url, date) or None
         """
         logger.info("Fetching latest perspective article...")
-        response = self.session.get(self.RSS_FEED_URL, timeout=self.timeout)
-        response.raise_for_status()
-
-        # Parse RSS XML
-        root = ET.fromstring(response.content)
-
-        # Look for perspective articles (URLs containing "pers-")
-        for item in root.findall('.//item'):
-            title_elem = item.find('title')
-            link_elem = item.find('link')
-            pubdate_elem = item.find('pubDate')
-            description_elem = item.find('description')
-
-            if title_elem is None or link_elem is None:
-                continue
-
-            url = link_elem.text
-
-            # Check if this is a perspective article (contains "pers-" in URL)
-            if '/pers-' in url:
-                title = title_elem.text
-
-                # Parse date
-                date_str = None
-                if pubdate_elem is not None:
-                    try:
-                        pub_date = parsedate_to_datetime(pubdate_elem.text)
-                        date_str = pub_date.strftime('%Y-%m-%d')
-                    except (ValueError, TypeError):
-                        pass
-
-                logger.info(f"Found perspective: {title}")
-                return {
-                    'title': title,
-                    'url': url,
-                    'date': date_str,
-                    'description': description_elem.text if description_elem is not None else ''
-                }
-
-        logger.warning("No perspective article found")
-        return None
+        _, perspective = self._parse_feed(hours=0)
+        if perspective:
+            logger.info(f"Found perspective: {perspective['title']}")
+        else:
+            logger.warning("No perspective article found")
+        return perspective
 
     def get_article_content(self, url: str) -> Dict[str, str]:
         """Fetch and extract the full content of an article.
@@ -161,72 +390,146 @@ class WWSSScraper:
         Returns:
             Dictionary with article content (title, text, date, author)
         """
+        if self.stream_pages:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                try:
+                    tree = lxml.html.parse(response.raw).getroot()
+                except (etree.ParserError, etree.XMLSyntaxError):
+                    tree = None
+            return _extract_from_tree(tree, url)
+
         response = self.session.get(url, timeout=self.timeout)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'lxml')
+        # Copy so callers can't mutate the cached entry
+        return dict(_extract_article(response.content, url))
 
-        # Extract title
-        title_elem = soup.find('h1')
-        title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
+    def fetch_summaries_only(self, hours: int = 24) -> Dict[str, any]:
+        """Build article content from the RSS feed alone, without fetching pages.
 
-        # Extract article text
-        article_body = soup.find('div', class_='article-content') or soup.find('article')
+        Each article's 'text' is its RSS description.
 
-        if article_body:
-            # Remove script and style elements
-            for script in article_body(['script', 'style']):
-                script.decompose()
+        Args:
+            hours: Number of hours to look back for recent articles
 
-            # Get text
-            paragraphs = article_body.find_all('p')
-            text = '\n\n'.join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+        Returns:
+            Dictionary with 'articles' and 'perspective' keys containing RSS-derived content
+        """
+        # Get recent articles and perspective metadata in a single feed pass
+        logger.info(f"Fetching recent articles from last {hours} hours...")
+        recent_articles, perspective_meta = self._parse_feed(hours)
+        logger.info(f"Found {len(recent_articles)} articles from last {hours} hours")
+        if perspective_meta:
+            logger.info(f"Found perspective: {perspective_meta['title']}")
         else:
-            text = ""
-
-        # Extract author
-        author_elem = soup.find('span', class_='author') or soup.find('a', rel='author')
-        author = author_elem.get_text(strip=True) if author_elem else "Unknown"
-
-        # Extract date
-        date_elem = soup.find('time') or soup.find('span', class_='date')
-        date = date_elem.get_text(strip=True) if date_elem else "Unknown"
+            logger.warning("No perspective article found")
 
         return {
-            'title': title,
-            'text': text,
-            'author': author,
-            'date': date,
-            'url': url
+            'articles': [_summary_content(meta) for meta in recent_articles],
+            'perspective': _summary_content(perspective_meta) if perspective_meta else None
         }
 
-    def fetch_all_content(self, hours: int = 24) -> Dict[str, any]:
-        """Fetch all articles and perspective with full content.
+    def fetch_full_content(self, urls: List[str]) -> Dict[str, Dict[str, str]]:
+        """Fetch the full content of the given article pages concurrently.
+
+        Args:
+            urls: Article URLs to fetch (duplicates are requested once)
+
+        Returns:
+            Dictionary mapping each URL to its extracted content
+        """
+        urls = list(dict.fromkeys(urls))
+        logger.info(f"Fetching content for {len(urls)} pages ({self.max_workers} workers)...")
+        pages = self._fetch_articles(urls)
+        logger.debug(f"Article extraction cache: {_extract_article.cache_info()}")
+        return pages
+
+    def fetch_all_content(self, hours: int = 24, fetch_full: bool = False) -> Dict[str, any]:
+        """Fetch recent articles and the perspective.
+
+        The perspective is always fetched in full. Recent articles use their RSS
+        description as text unless fetch_full is set, which saves one page
+        download per article.
 
         Args:
             hours: Number of hours to look back for recent articles
+            fetch_full: Fetch the full page content of every recent article too
 
         Returns:
-            Dictionary with 'articles' and 'perspective' keys containing full content
+            Dictionary with 'articles' and 'perspective' keys
         """
-        result = {
-            'articles': [],
-            'perspective': None
-        }
+        result = self.fetch_summaries_only(hours)
 
-        # Get recent articles
-        recent_articles = self.get_recent_articles(hours)
-        logger.info(f"Fetching content for {len(recent_articles)} recent articles...")
+        urls = [article['url'] for article in result['articles']] if fetch_full else []
+        if result['perspective']:
+            urls.append(result['perspective']['url'])
 
-        for i, article_meta in enumerate(recent_articles, 1):
-            logger.debug(f"[{i}/{len(recent_articles)}] {article_meta['title'][:60]}...")
-            content = self.get_article_content(article_meta['url'])
-            result['articles'].append(content)
+        pages = self.fetch_full_content(urls)
 
-        # Get perspective
-        perspective_meta = self.get_latest_perspective()
-        if perspective_meta:
-            logger.info("Fetching perspective content...")
-            result['perspective'] = self.get_article_content(perspective_meta['url'])
+        if fetch_full:
+            result['articles'] = [pages[article['url']] for article in result['articles']]
+        if result['perspective']:
+            result['perspective'] = pages[result['perspective']['url']]
 
         return result
+
+    def _fetch_articles(self, urls: List[str]) -> Dict[str, Dict[str, str]]:
+        """Fetch and extract several articles concurrently.
+
+        Args:
+            urls: Article URLs to fetch
+
+        Returns:
+            Dictionary mapping each URL to its extracted content
+        """
+        if not urls:
+            return {}
+
+        if self.use_http2:
+            return asyncio.run(self._afetch_articles(urls))
+
+        workers = min(self.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            contents = executor.map(self.get_article_content, urls)
+            pages = {}
+            for i, (url, content) in enumerate(zip(urls, contents), 1):
+                logger.debug(f"[{i}/{len(urls)}] {content['title'][:60]}...")
+                pages[url] = content
+
+        return pages
+
+    async def _afetch_articles(self, urls: List[str]) -> Dict[str, Dict[str, str]]:
+        """Fetch and extract several articles over one multiplexed HTTP/2 connection.
+
+        Args:
+            urls: Article URLs to fetch
+
+        Returns:
+            Dictionary mapping each URL to its extracted content
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        transport = httpx.AsyncHTTPTransport(http2=True, retries=3)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+
+        async with httpx.AsyncClient(
+            transport=transport,
+            headers=headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+        ) as client:
+
+            async def fetch(url: str) -> Dict[str, str]:
+                async with semaphore:
+                    response = await client.get(url)
+                response.raise_for_status()
+                return dict(_extract_article(response.content, url))
+
+            contents = await asyncio.gather(*(fetch(url) for url in urls))
+
+        pages = {}
+        for i, (url, content) in enumerate(zip(urls, contents), 1):
+            logger.debug(f"[{i}/{len(urls)}] {content['title'][:60]}...")
+            pages[url] = content
+        return pages
@@ -1,11 +1,16 @@
 """AI-powered synthesis and summarization of WSWS articles."""
 
+import io
 import logging
-from typing import Dict, List, Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 import os
 
-from anthropic import Anthropic
-from openai import OpenAI
+import orjson
+
+from .cache import ResponseCache, make_key
 
 logger = logging.getLogger(__name__)
 
@@ -28,25 +33,136 @@ Focus on:
 Your analysis should be sophisticated, assuming the reader is familiar with Marxist concepts
 and the political perspective of the International Committee of the Fourth International (ICFI)."""
 
-    def __init__(self, provider: str = "anthropic", api_key: Optional[str] = None, model: Optional[str] = None):
+    BATCH_SUMMARY_PROMPT = """For each article below (delimited by <ART id=N>...</ART>), write a
+concise summary of 3-5 sentences that keeps the key facts, the class forces involved and the
+political conclusions drawn by the author.
+
+Return a JSON object mapping each article id to its summary, for example
+{"1": "...", "2": "..."}. Respond with JSON only."""
+
+    SYNTHESIS_INSTRUCTIONS = """Please analyze and synthesize the WSWS articles provided above into a
+comprehensive daily bulletin. Structure your analysis as follows:
+
+1. **Executive Summary**: A brief overview of the most critical developments (2-3 paragraphs)
+
+2. **Major Political Developments**: Detailed analysis of the most important events, organized
+   by region or theme, with focus on:
+   - The class forces involved
+   - The political trajectory and implications
+   - Connection to broader historical processes
+
+3. **Theoretical and Historical Insights**: Draw out the key theoretical lessons, including:
+   - Historical parallels and precedents
+   - Development of class contradictions
+   - Strategic questions for the working class
+   - Significance for socialist perspective
+
+4. **International Connections**: How different events and struggles relate to each other
+   as part of global class struggle
+
+5. **Key Takeaways**: 3-5 essential points for revolutionary socialists to understand
+
+Start each section with its title as a level-2 Markdown heading, exactly:
+## Executive Summary
+## Major Political Developments
+## Theoretical and Historical Insights
+## International Connections
+## Key Takeaways"""
+
+    # Section keys and the headings the synthesis uses for them, in order
+    SECTIONS = (
+        ("executive_summary", "Executive Summary"),
+        ("major_developments", "Major Political Developments"),
+        ("theory", "Theoretical and Historical Insights"),
+        ("international", "International Connections"),
+        ("takeaways", "Key Takeaways"),
+    )
+
+    _SECTION_HEADING_RE = re.compile(
+        r'^##\s*(' + '|'.join(re.escape(heading) for _, heading in SECTIONS) + r')\s*$',
+        re.MULTILINE
+    )
+
+    # Articles per summary request, and summary requests run at once, when condensing
+    MAP_BATCH_SIZE = 6
+    MAP_CONCURRENCY = 8
+
+    # Identifies the bulletin request within a Batch API submission
+    BATCH_CUSTOM_ID = "bulletin"
+
+    # Output token limits of known models, matched by name prefix (longest
+    # first); any other model is held to DEFAULT_MAX_OUTPUT_TOKENS
+    MODEL_MAX_OUTPUT_TOKENS = {
+        "claude-3-haiku": 4096,
+        "claude-3-opus": 4096,
+        "claude-3-5": 8192,
+        "claude-3-7-sonnet": 64000,
+        "claude-haiku-4": 64000,
+        "claude-sonnet-4": 64000,
+        "claude-opus-4": 32000,
+        "gpt-4o": 16384,
+        "gpt-4.1": 32768,
+        "gpt-4-turbo": 4096,
+        "gpt-3.5-turbo": 4096,
+    }
+    DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+    def __init__(
+        self,
+        provider: str = "anthropic",
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        fallback_model: Optional[str] = None,
+        timeout: float = 600.0,
+        max_retries: int = 3
+    ):
         """Initialize the synthesizer.
 
         Args:
             provider: AI provider ("openai" or "anthropic")
             api_key: API key for the chosen provider
             model: Model name (optional, uses default for provider if not specified)
+            cache: Optional persistent cache for synthesis results
+            fallback_model: Model to try once when a request still fails after
+                all retries (optional)
+            timeout: Per-request timeout in seconds; a non-streaming request
+                sends nothing until the whole completion is done, so this
+                must cover generating the full synthesis
+            max_retries: Retries, with exponential backoff, on timeouts,
+                connection errors, rate limits and server errors
         """
         self.provider = provider.lower()
+        self.cache = cache
+        self.fallback_model = fallback_model
 
+        # Provider SDKs are imported on demand; each is slow to import
         if self.provider == "anthropic":
-            self.client = Anthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
+            import anthropic as sdk
+
+            self.client = sdk.Anthropic(
+                api_key=api_key or os.getenv("ANTHROPIC_API_KEY"),
+                timeout=timeout,
+                max_retries=max_retries
+            )
             self.model = model or os.getenv("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001")
         elif self.provider == "openai":
-            self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+            import openai as sdk
+
+            self.client = sdk.OpenAI(
+                api_key=api_key or os.getenv("OPENAI_API_KEY"),
+                timeout=timeout,
+                max_retries=max_retries
+            )
             self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o")
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
+        # Failures the SDK retries; if they persist, the fallback model is tried
+        self._transient_errors = (
+            sdk.APITimeoutError, sdk.APIConnectionError, sdk.RateLimitError, sdk.InternalServerError
+        )
+
     def _format_articles_for_prompt(self, content: Dict[str, any]) -> str:
         """Format article content into a prompt string.
 
@@ -55,120 +171,613 @@ and the political perspective of the International Committee of the Fourth Inter
 
         Returns:
             Formatted string for the AI prompt
+
+        Articles are ordered by URL so the same article set always renders to
+        the same bytes, keeping the provider's prompt cache prefix stable.
         """
-        parts = []
+        buf = io.StringIO()
 
         # Add perspective first (most important)
         if content.get('perspective'):
             p = content['perspective']
-            parts.append(f"=== PERSPECTIVE (FEATURED ANALYSIS) ===\n")
-            parts.append(f"Title: {p['title']}\n")
-            parts.append(f"Author: {p['author']}\n")
-            parts.append(f"Date: {p['date']}\n")
-            parts.append(f"URL: {p['url']}\n\n")
-            parts.append(f"{p['text']}\n\n")
+            buf.write(
+                f"=== PERSPECTIVE (FEATURED ANALYSIS) ===\n"
+                f"Title: {p['title']}\nAuthor: {p['author']}\nDate: {p['date']}\nURL: {p['url']}\n\n"
+                f"{p['text']}\n\n"
+            )
 
         # Add recent articles
         if content.get('articles'):
-            parts.append(f"=== RECENT ARTICLES ({len(content['articles'])} articles) ===\n\n")
-            for i, article in enumerate(content['articles'], 1):
-                parts.append(f"--- Article {i} ---\n")
-                parts.append(f"Title: {article['title']}\n")
-                parts.append(f"Author: {article['author']}\n")
-                parts.append(f"Date: {article['date']}\n")
-                parts.append(f"URL: {article['url']}\n\n")
-                parts.append(f"{article['text']}\n\n")
-
-        return "".join(parts)
-
-    def synthesize(self, content: Dict[str, any]) -> str:
-        """Synthesize and summarize the article content.
+            buf.write(f"=== RECENT ARTICLES ({len(content['articles'])} articles) ===\n\n")
+            articles = sorted(content['articles'], key=lambda article: article['url'])
+            for i, article in enumerate(articles, 1):
+                buf.write(
+                    f"--- Article {i} ---\n"
+                    f"Title: {article['title']}\nAuthor: {article['author']}\n"
+                    f"Date: {article['date']}\nURL: {article['url']}\n\n"
+                    f"{article['text']}\n\n"
+                )
+
+        return buf.getvalue()
+
+    def _request_params(
+        self,
+        system: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        context: Optional[str] = None,
+        max_tokens: int = 4096
+    ) -> Dict[str, any]:
+        """Build provider request parameters for a system + user prompt.
+
+        The same parameters are used for live calls and Batch API submissions.
+
+        Bulk context (the articles) is sent as part of the system prompt so it
+        forms a stable prefix the provider can cache: Anthropic gets it as a
+        separate system block marked with cache_control, and OpenAI gets it at
+        the head of the system message, where automatic prefix caching applies.
 
         Args:
-            content: Dictionary with 'articles' and 'perspective' keys
+            system: System prompt
+            user_prompt: User message
+            json_mode: Ask the provider for a JSON object response
+            context: Optional bulk context to place in the cacheable prefix
+            max_tokens: Output token limit for the response
 
         Returns:
-            Synthesized summary text
+            Keyword arguments for messages.create / chat.completions.create
         """
-        articles_text = self._format_articles_for_prompt(content)
+        if self.provider == "anthropic":
+            if context:
+                system = [
+                    {"type": "text", "text": system},
+                    {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}},
+                ]
+            return {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "system": system,
+                "messages": [
+                    {"role": "user", "content": user_prompt}
+                ],
+            }
+
+        # openai
+        if context:
+            system = f"{context}\n\n{system}"
+        params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user_prompt}
+            ],
+            "max_tokens": max_tokens,
+        }
+        if json_mode:
+            params["response_format"] = {"type": "json_object"}
+        return params
+
+    def _complete(
+        self,
+        system: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        context: Optional[str] = None,
+        max_tokens: int = 4096,
+        outcome: Optional[Dict[str, any]] = None
+    ) -> str:
+        """Send a single system + user prompt to the configured provider.
 
-        user_prompt = f"""Please analyze and synthesize the following WSWS articles into a
-comprehensive daily bulletin. Structure your analysis as follows:
+        Args:
+            system: System prompt
+            user_prompt: User message
+            json_mode: Ask the provider for a JSON object response
+            context: Optional bulk context to place in the cacheable prefix
+            max_tokens: Output token limit for the response
+            outcome: Optional dict that receives 'model', the model that
+                answered, and 'truncated', True when the response was cut
+                off by max_tokens
 
-1. **Executive Summary**: A brief overview of the most critical developments (2-3 paragraphs)
+        Returns:
+            Text of the model response
+        """
+        params = self._request_params(
+            system, user_prompt, json_mode=json_mode, context=context, max_tokens=max_tokens
+        )
+
+        if outcome is None:
+            outcome = {}
+
+        start = time.perf_counter()
+        try:
+            text = self._create(params, outcome)
+        except self._transient_errors as e:
+            if not self._use_fallback(params, e):
+                raise
+            text = self._create(params, outcome)
+        logger.debug(f"{params['model']} responded in {time.perf_counter() - start:.1f}s")
+        return text
+
+    def _create(self, params: Dict[str, any], outcome: Dict[str, any]) -> str:
+        """Send one non-streaming request and return the response text."""
+        outcome["model"] = params["model"]
+        if self.provider == "anthropic":
+            response = self.client.messages.create(**params)
+            outcome["truncated"] = self._check_stop_reason(params, response.stop_reason)
+            return response.content[0].text
 
-2. **Major Political Developments**: Detailed analysis of the most important events, organized
-   by region or theme, with focus on:
-   - The class forces involved
-   - The political trajectory and implications
-   - Connection to broader historical processes
+        # openai
+        response = self.client.chat.completions.create(**params)
+        outcome["truncated"] = self._check_stop_reason(params, response.choices[0].finish_reason)
+        return response.choices[0].message.content
 
-3. **Theoretical and Historical Insights**: Draw out the key theoretical lessons, including:
-   - Historical parallels and precedents
-   - Development of class contradictions
-   - Strategic questions for the working class
-   - Significance for socialist perspective
+    @staticmethod
+    def _check_stop_reason(params: Dict[str, any], stop_reason: Optional[str]) -> bool:
+        """Log a warning when a response was cut off by its max_tokens limit.
 
-4. **International Connections**: How different events and struggles relate to each other
-   as part of global class struggle
+        Returns:
+            True if the response is truncated
+        """
+        if stop_reason in ("max_tokens", "length"):
+            logger.warning(
+                f"{params['model']} response hit the max_tokens limit ({params['max_tokens']}) "
+                f"and is truncated"
+            )
+            return True
+        return False
 
-5. **Key Takeaways**: 3-5 essential points for revolutionary socialists to understand
+    @classmethod
+    def _max_output_tokens(cls, model: str) -> int:
+        """Output token limit of a model, or DEFAULT_MAX_OUTPUT_TOKENS if it is not known."""
+        for prefix in sorted(cls.MODEL_MAX_OUTPUT_TOKENS, key=len, reverse=True):
+            if model.startswith(prefix):
+                return cls.MODEL_MAX_OUTPUT_TOKENS[prefix]
+        return cls.DEFAULT_MAX_OUTPUT_TOKENS
 
-Here are the articles:
+    def _use_fallback(self, params: Dict[str, any], error: Exception) -> bool:
+        """Switch request parameters to the fallback model after a persistent failure.
 
-{articles_text}"""
+        Args:
+            params: Request parameters, updated in place
+            error: The error raised after the SDK's retries were exhausted
 
-        logger.info("Generating synthesis using AI...")
+        Returns:
+            True if the request should be retried with the fallback model
+        """
+        if not self.fallback_model or params["model"] == self.fallback_model:
+            return False
+        logger.warning(f"{params['model']} failed ({error}); retrying with {self.fallback_model}")
+        params["model"] = self.fallback_model
+        params["max_tokens"] = min(params["max_tokens"], self._max_output_tokens(self.fallback_model))
+        return True
+
+    def _stream(
+        self,
+        system: str,
+        user_prompt: str,
+        context: Optional[str] = None,
+        max_tokens: int = 4096,
+        outcome: Optional[Dict[str, any]] = None
+    ) -> Iterator[str]:
+        """Stream the response to a system + user prompt as text deltas.
 
+        Args:
+            system: System prompt
+            user_prompt: User message
+            context: Optional bulk context to place in the cacheable prefix
+            max_tokens: Output token limit for the response
+            outcome: Optional dict that receives 'model', the model that
+                answered, and 'truncated', True when the response was cut
+                off by max_tokens, once the stream ends
+
+        Yields:
+            Text fragments as the provider produces them
+        """
+        params = self._request_params(system, user_prompt, context=context, max_tokens=max_tokens)
+        if outcome is None:
+            outcome = {}
+
+        started = False
+        try:
+            for piece in self._create_stream(params, outcome):
+                started = True
+                yield piece
+        except self._transient_errors as e:
+            # Text already passed on cannot be taken back, so only a stream
+            # that failed before producing anything is retried
+            if started or not self._use_fallback(params, e):
+                raise
+            yield from self._create_stream(params, outcome)
+
+    def _create_stream(self, params: Dict[str, any], outcome: Dict[str, any]) -> Iterator[str]:
+        """Send one streaming request and yield its text deltas."""
+        outcome["model"] = params["model"]
         if self.provider == "anthropic":
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=self.SYSTEM_PROMPT,
-                messages=[
-                    {"role": "user", "content": user_prompt}
+            with self.client.messages.stream(**params) as stream:
+                yield from stream.text_stream
+                outcome["truncated"] = self._check_stop_reason(
+                    params, stream.get_final_message().stop_reason
+                )
+            return
+
+        # openai
+        stream = self.client.chat.completions.create(**params, stream=True)
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            if chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.choices[0].finish_reason:
+                outcome["truncated"] = self._check_stop_reason(params, chunk.choices[0].finish_reason)
+
+    def summarize_articles(self, articles: List[Dict[str, str]]) -> List[str]:
+        """Summarize several articles with a single batched LLM call.
+
+        Args:
+            articles: Article dictionaries with 'title' and 'text' keys
+
+        Returns:
+            One summary per article, in input order (the original text is kept
+            for any article the model did not return a summary for)
+        """
+        if not articles:
+            return []
+
+        blocks = [
+            f"<ART id={i}>\nTitle: {article['title']}\n\n{article['text']}\n</ART>"
+            for i, article in enumerate(articles, 1)
+        ]
+        user_prompt = "\n\n".join(blocks)
+
+        logger.info(f"Summarizing {len(articles)} articles in one batched request...")
+        raw = self._complete(
+            self.BATCH_SUMMARY_PROMPT, user_prompt, json_mode=True,
+            max_tokens=min(4096, 256 + 200 * len(articles))
+        )
+
+        # Tolerate code fences or surrounding prose around the JSON object
+        start, end = raw.find("{"), raw.rfind("}")
+        try:
+            summaries = orjson.loads(raw[start:end + 1]) if start != -1 else {}
+        except ValueError:
+            logger.warning("Batched summary response was not valid JSON; using full texts")
+            summaries = {}
+        if not isinstance(summaries, dict):
+            summaries = {}
+
+        result = []
+        for i, article in enumerate(articles, 1):
+            summary = summaries.get(str(i))
+            if not summary:
+                logger.warning(f"No summary returned for article {i}: {article['title'][:60]}")
+                summary = article['text']
+            result.append(summary)
+        return result
+
+    def condense_content(self, content: Dict[str, any]) -> Dict[str, any]:
+        """Replace recent article texts with batched summaries.
+
+        Articles are summarized in groups of MAP_BATCH_SIZE, with up to
+        MAP_CONCURRENCY requests in flight, so the wall time stays close to
+        that of one short request however many articles there are. The
+        perspective keeps its full text, as it anchors the bulletin.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+
+        Returns:
+            Copy of content with summarized article texts
+        """
+        articles = content.get('articles') or []
+        batches = [
+            articles[i:i + self.MAP_BATCH_SIZE] for i in range(0, len(articles), self.MAP_BATCH_SIZE)
+        ]
+
+        if len(batches) <= 1:
+            summaries = self.summarize_articles(articles)
+        else:
+            logger.info(f"Summarizing {len(articles)} articles in {len(batches)} concurrent requests...")
+            with ThreadPoolExecutor(max_workers=min(self.MAP_CONCURRENCY, len(batches))) as pool:
+                summaries = [
+                    summary for batch in pool.map(self.summarize_articles, batches) for summary in batch
                 ]
-            )
-            synthesis = response.content[0].text
 
-        else:  # openai
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=4096
-            )
-            synthesis = response.choices[0].message.content
+        return {
+            **content,
+            'articles': [
+                {**article, 'text': summary} for article, summary in zip(articles, summaries)
+            ],
+        }
+
+    def _synthesis_max_tokens(self, content: Dict[str, any]) -> int:
+        """Output token limit for a synthesis, scaled to the number of articles.
+
+        At least 4096 tokens are allowed for the full five-section bulletin,
+        growing with the article count up to the model's own output limit.
+        Truncated responses are logged and never cached.
+        """
+        wanted = max(4096, 1024 + 80 * len(content.get('articles') or []))
+        return min(wanted, self._max_output_tokens(self.model))
+
+    def _build_synthesis_prompt(self, content: Dict[str, any]) -> Tuple[str, str]:
+        """Build the synthesis request as a cacheable context plus instructions.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+
+        Returns:
+            Tuple of (articles context, user instructions)
+        """
+        return self._format_articles_for_prompt(content), self.SYNTHESIS_INSTRUCTIONS
+
+    def _synthesis_cache_key(self, articles_text: str, instructions: str) -> Optional[str]:
+        """Cache key for a synthesis of the given prompt, or None without a cache.
+
+        The key covers the exact request (model, system prompt, articles and
+        instructions), so editing any prompt invalidates earlier results.
+        """
+        if self.cache is None:
+            return None
+        return make_key(
+            "synthesis", self.provider, self.model, self.SYSTEM_PROMPT, articles_text, instructions
+        )
+
+    def _bulletin_cache_key(self, content: Dict[str, any], batched: bool) -> Optional[str]:
+        """Cache key for a synthesis of the scraped content, or None without a cache.
+
+        Looked up before any summarization or prompt building, so an unchanged
+        article set goes straight to the stored synthesis. The key includes the
+        prompts, so editing them invalidates earlier results.
+        """
+        if self.cache is None:
+            return None
+        content = {
+            **content,
+            'articles': sorted(content.get('articles') or [], key=lambda article: article['url']),
+        }
+        prompts = (
+            self.SYSTEM_PROMPT,
+            self.SYNTHESIS_INSTRUCTIONS,
+            self.BATCH_SUMMARY_PROMPT if batched else None,
+        )
+        return make_key("bulletin", self.provider, self.model, prompts, content)
+
+    def _cache_get(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return a cached synthesis, if any."""
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        logger.info("Using cached synthesis")
+        return cached.decode("utf-8")
+
+    def _cache_set(self, cache_key: Optional[str], synthesis: str, outcome: Dict[str, any]):
+        """Store a synthesis in the cache, if enabled and the response was complete.
+
+        Keys are built from the primary model, so a synthesis written by the
+        fallback model is not stored under them.
+        """
+        if cache_key is None or not synthesis:
+            return
+        if outcome.get("truncated"):
+            logger.info("Not caching truncated synthesis")
+            return
+        if outcome.get("model", self.model) != self.model:
+            logger.info(f"Not caching synthesis from fallback model {outcome['model']}")
+            return
+        self.cache.set(cache_key, synthesis)
+
+    def synthesize(self, content: Dict[str, any], outcome: Optional[Dict[str, any]] = None) -> str:
+        """Synthesize and summarize the article content.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+            outcome: Optional dict that receives 'model' and 'truncated' (see _complete)
+
+        Returns:
+            Synthesized summary text
+        """
+        articles_text, instructions = self._build_synthesis_prompt(content)
+        cache_key = self._synthesis_cache_key(articles_text, instructions)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        if outcome is None:
+            outcome = {}
 
+        logger.info("Generating synthesis using AI...")
+        synthesis = self._complete(
+            self.SYSTEM_PROMPT, instructions, context=articles_text,
+            max_tokens=self._synthesis_max_tokens(content), outcome=outcome
+        )
         logger.info("Synthesis complete!")
+        self._check_sections(synthesis)
+
+        self._cache_set(cache_key, synthesis, outcome)
         return synthesis
 
-    def generate_bulletin(self, content: Dict[str, any], title: Optional[str] = None) -> str:
+    def stream_synthesis(
+        self,
+        content: Dict[str, any],
+        outcome: Optional[Dict[str, any]] = None
+    ) -> Iterator[str]:
+        """Stream the synthesis of the article content as it is generated.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+            outcome: Optional dict that receives 'model' and 'truncated' (see _stream)
+
+        Yields:
+            Fragments of the synthesized summary text
+        """
+        articles_text, instructions = self._build_synthesis_prompt(content)
+        cache_key = self._synthesis_cache_key(articles_text, instructions)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        if outcome is None:
+            outcome = {}
+
+        logger.info("Streaming synthesis using AI...")
+        pieces = []
+        for piece in self._stream(
+            self.SYSTEM_PROMPT, instructions, context=articles_text,
+            max_tokens=self._synthesis_max_tokens(content), outcome=outcome
+        ):
+            pieces.append(piece)
+            yield piece
+        logger.info("Synthesis complete!")
+
+        synthesis = "".join(pieces)
+        self._check_sections(synthesis)
+        self._cache_set(cache_key, synthesis, outcome)
+
+    @classmethod
+    def split_sections(cls, synthesis: str) -> Dict[str, str]:
+        """Split a synthesis into its sections by their fixed headings.
+
+        Args:
+            synthesis: Synthesized summary text
+
+        Returns:
+            Mapping of section key (see SECTIONS) to section text, without the
+            heading, in the order the sections appear; missing sections are omitted
+        """
+        keys = {heading: key for key, heading in cls.SECTIONS}
+        matches = list(cls._SECTION_HEADING_RE.finditer(synthesis))
+
+        sections = {}
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(synthesis)
+            sections[keys[match.group(1)]] = synthesis[match.end():end].strip()
+        return sections
+
+    def _check_sections(self, synthesis: str):
+        """Log a warning when the synthesis is missing any expected section."""
+        missing = [heading for key, heading in self.SECTIONS if key not in self.split_sections(synthesis)]
+        if missing:
+            logger.warning(f"Synthesis is missing sections: {', '.join(missing)}")
+
+    def stream_bulletin(
+        self,
+        content: Dict[str, any],
+        title: Optional[str] = None,
+        batched: bool = False
+    ) -> Iterator[str]:
+        """Stream a complete bulletin: header, synthesis fragments, then sources.
+
+        Joining the yielded fragments gives the same text as generate_bulletin.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+            title: Optional custom title
+            batched: Condense the recent articles with one batched summary call
+                before synthesis, keeping the synthesis prompt short
+
+        Yields:
+            Fragments of the bulletin text
+        """
+        yield self._bulletin_header(title)
+
+        cache_key = self._bulletin_cache_key(content, batched)
+        synthesis = self._cache_get(cache_key)
+        if synthesis is not None:
+            yield synthesis
+        else:
+            pieces = []
+            outcome = {}
+            for piece in self.stream_synthesis(
+                self.condense_content(content) if batched else content, outcome=outcome
+            ):
+                pieces.append(piece)
+                yield piece
+            self._cache_set(cache_key, "".join(pieces), outcome)
+
+        yield self._bulletin_footer(content)
+
+    def generate_bulletin(
+        self,
+        content: Dict[str, any],
+        title: Optional[str] = None,
+        batched: bool = False
+    ) -> str:
         """Generate a complete bulletin with header and synthesis.
 
         Args:
             content: Dictionary with 'articles' and 'perspective' keys
             title: Optional custom title
+            batched: Condense the recent articles with one batched summary call
+                before synthesis, keeping the synthesis prompt short
+
+        Returns:
+            Complete bulletin text with formatting
+        """
+        cache_key = self._bulletin_cache_key(content, batched)
+        synthesis = self._cache_get(cache_key)
+        if synthesis is None:
+            outcome = {}
+            synthesis = self.synthesize(
+                self.condense_content(content) if batched else content, outcome=outcome
+            )
+            self._cache_set(cache_key, synthesis, outcome)
+        return self.format_bulletin(content, synthesis, title=title)
+
+    def format_bulletin(
+        self,
+        content: Dict[str, any],
+        synthesis: str,
+        title: Optional[str] = None
+    ) -> str:
+        """Wrap a synthesis with the bulletin header and source article list.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+            synthesis: Synthesized summary text
+            title: Optional custom title
 
         Returns:
             Complete bulletin text with formatting
         """
+        return self._bulletin_header(title) + synthesis + self._bulletin_footer(content)
+
+    def _bulletin_header(self, title: Optional[str] = None) -> str:
+        """Build the bulletin title block that precedes the synthesis.
+
+        Args:
+            title: Optional custom title
+
+        Returns:
+            Header text, ending with a blank line
+        """
         from datetime import datetime
 
         if title is None:
             title = f"WSWS Daily Bulletin - {datetime.now().strftime('%B %d, %Y')}"
 
-        synthesis = self.synthesize(content)
-
-        # Format the complete bulletin
-        bulletin_parts = [
+        header_parts = [
             "=" * 80,
             title.center(80),
             "=" * 80,
             "",
-            synthesis,
+        ]
+        return "\n".join(header_parts) + "\n"
+
+    def _bulletin_footer(self, content: Dict[str, any]) -> str:
+        """Build the generation timestamp and source list that follow the synthesis.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+
+        Returns:
+            Footer text, starting with a blank line
+        """
+        from datetime import datetime
+
+        bulletin_parts = [
             "",
             "=" * 80,
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
@@ -187,4 +796,92 @@ Here are the articles:
 
         bulletin_parts.append("=" * 80)
 
-        return "\n".join(bulletin_parts)
+        return "\n" + "\n".join(bulletin_parts)
+
+    def submit_batch(self, content: Dict[str, any]) -> str:
+        """Submit the synthesis request through the provider's Batch API.
+
+        Batch requests are billed at a discount and complete within 24 hours.
+
+        Args:
+            content: Dictionary with 'articles' and 'perspective' keys
+
+        Returns:
+            Provider batch ID
+        """
+        articles_text, instructions = self._build_synthesis_prompt(content)
+        params = self._request_params(
+            self.SYSTEM_PROMPT, instructions, context=articles_text,
+            max_tokens=self._synthesis_max_tokens(content)
+        )
+
+        if self.provider == "anthropic":
+            batch = self.client.messages.batches.create(
+                requests=[{"custom_id": self.BATCH_CUSTOM_ID, "params": params}]
+            )
+        else:  # openai
+            request_line = {
+                "custom_id": self.BATCH_CUSTOM_ID,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": params,
+            }
+            batch_file = self.client.files.create(
+                file=("bulletin_batch.jsonl", orjson.dumps(request_line)),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+        logger.info(f"Submitted synthesis batch: {batch.id}")
+        return batch.id
+
+    def retrieve_batch(self, batch_id: str) -> Optional[str]:
+        """Fetch the synthesis produced by a Batch API submission.
+
+        Args:
+            batch_id: Provider batch ID returned by submit_batch
+
+        Returns:
+            Synthesized summary text, or None if the batch is still processing
+
+        Raises:
+            RuntimeError: If the batch finished without a usable result
+        """
+        if self.provider == "anthropic":
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != "ended":
+                logger.info(f"Batch {batch_id} is {batch.processing_status}")
+                return None
+
+            for entry in self.client.messages.batches.results(batch_id):
+                if entry.custom_id != self.BATCH_CUSTOM_ID:
+                    continue
+                if entry.result.type != "succeeded":
+                    raise RuntimeError(f"Batch {batch_id} request {entry.result.type}")
+                return entry.result.message.content[0].text
+
+            raise RuntimeError(f"Batch {batch_id} returned no result")
+
+        # openai
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing"):
+            logger.info(f"Batch {batch_id} is {batch.status}")
+            return None
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            record = orjson.loads(line)
+            if record.get("custom_id") != self.BATCH_CUSTOM_ID:
+                continue
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                raise RuntimeError(f"Batch {batch_id} request failed: {record.get('error')}")
+            return response["body"]["choices"][0]["message"]["content"]
+
+        raise RuntimeError(f"Batch {batch_id} returned no result")
@@ -1,115 +1,760 @@
 """Text-to-speech conversion for bulletins."""
 
+import asyncio
 import logging
+import multiprocessing
 import os
+import queue
+import re
+import threading
+import wave
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
 
-try:
-    from TTS.api import TTS as CoquiTTS
-    COQUI_AVAILABLE = True
-except ImportError:
-    COQUI_AVAILABLE = False
+from .cache import ResponseCache, make_key
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Check availability without importing: Coqui pulls in torch, which takes
+# seconds and hundreds of MB. The engines are imported when instantiated.
+COQUI_AVAILABLE = find_spec("TTS") is not None and find_spec("numpy") is not None
+OPENAI_AVAILABLE = find_spec("openai") is not None
+ONNX_AVAILABLE = find_spec("onnxruntime") is not None and find_spec("onnx") is not None
 
 logger = logging.getLogger(__name__)
 
+# Default local model: VITS is non-autoregressive and runs several times faster
+# than realtime on CPU, and has no minimum input length
+DEFAULT_COQUI_MODEL = "tts_models/en/ljspeech/vits"
+
+# Default OpenAI model: tts-1 has about half the latency and cost of tts-1-hd,
+# with little audible difference for spoken news
+DEFAULT_OPENAI_TTS_MODEL = "tts-1"
+
+# Exported and INT8-quantized Coqui models are kept here, one file per model
+ONNX_CACHE_DIR = Path.home() / '.cache' / 'wsws-bulletin' / 'onnx'
+
+# Very short Coqui segments are merged with their neighbours to keep per-call
+# overhead down
+COQUI_MIN_SEGMENT_CHARS = 50
+
+# Tacotron2 models fail with kernel size errors on shorter inputs; VITS has no minimum
+TACOTRON_MIN_CHARS = 50
+
+# Sentence end (optionally closed by a quote or bracket) or paragraph break
+_SENTENCE_END_RE = re.compile(r'[.?!]["\')\]]*\s+|\n\s*\n')
+
+# Streamed text is flushed to TTS at least every this many words
+MAX_SEGMENT_WORDS = 80
+_WORD_RE = re.compile(r'\S+')
+
+# Each OpenAI TTS request costs a round trip, so streamed text is sent in larger pieces
+OPENAI_MIN_SEGMENT_CHARS = 400
+
+# Linear fade applied at each end of a Coqui segment to avoid clicks at the joins
+SEGMENT_FADE_SECONDS = 0.002
+
+
+def _next_cut(buffer: str, min_chars: int, max_words: int) -> Optional[int]:
+    """Find where the next segment ends in the buffered text.
+
+    Args:
+        buffer: Text not yet emitted
+        min_chars: Minimum segment length
+        max_words: Maximum words per segment
+
+    Returns:
+        Index just past the end of the next segment, or None to wait for more text
+    """
+    # Start of the first word beyond the budget, if the buffer has one
+    words = list(_WORD_RE.finditer(buffer))
+    limit = words[max_words].start() if len(words) > max_words else None
+
+    last_end = None
+    for match in _SENTENCE_END_RE.finditer(buffer):
+        if limit is not None and match.end() > limit:
+            break
+        if match.end() >= min_chars:
+            return match.end()
+        last_end = match.end()
+
+    if limit is None:
+        return None
+    # Over budget: cut at the last sentence end within it, else at a word boundary
+    return last_end or limit
+
+
+def iter_segments(
+    pieces: Iterable[str],
+    min_chars: int = 0,
+    max_words: int = MAX_SEGMENT_WORDS
+) -> Iterator[str]:
+    """Group streamed text fragments into sentence-bounded segments.
+
+    A segment is emitted at the first sentence end (., ? or !) or paragraph
+    break that leaves it at least min_chars long, and the buffer is split
+    repeatedly, so one long fragment yields many segments. Text that runs past
+    max_words is cut at the last sentence end within the budget, or at a word
+    boundary if it has none, even when that leaves it shorter than min_chars.
+    A short trailing remainder is merged into the last segment when the
+    result stays within max_words, rather than emitted alone.
+
+    Args:
+        pieces: Text fragments, e.g. tokens streamed from an LLM
+        min_chars: Minimum segment length
+        max_words: Flush a segment once it grows past this many words
+
+    Yields:
+        Text segments ready for speech synthesis
+    """
+    buffer = ""
+    pending = None
+
+    for piece in pieces:
+        buffer += piece
+
+        while True:
+            cut = _next_cut(buffer, min_chars, max_words)
+            if cut is None:
+                break
+
+            segment, buffer = buffer[:cut].strip(), buffer[cut:]
+            if not segment:
+                continue
+            # Hold one segment back so a short tail can still be merged into it
+            if pending is not None:
+                yield pending
+            pending = segment
+
+    tail = buffer.strip()
+    if (
+        pending is not None and tail and len(tail) < min_chars
+        and len(pending.split()) + len(tail.split()) <= max_words
+    ):
+        pending = f"{pending}\n{tail}"
+        tail = ""
+    if pending:
+        yield pending
+    if tail:
+        yield tail
+
+
+# Bulletin lines that are not spoken: the "=" rules framing the header and
+# footer (which also separate the bulletin's parts) and the generation timestamp
+_RULE_RE = re.compile(r'[ \t]*={10,}[ \t]*')
+_TIMESTAMP_PREFIX = "Generated: "
+
+
+def _is_unspoken_prefix(line: str) -> bool:
+    """Whether an incomplete line could still turn out to be an unspoken line."""
+    return set(line.strip()) <= {"="} or line.startswith(_TIMESTAMP_PREFIX) or _TIMESTAMP_PREFIX.startswith(line)
+
+
+def _tag_bulletin_lines(pieces: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Tag streamed bulletin text with the index of the part it belongs to.
+
+    Text is passed on as it arrives, except for a line start that may still
+    become a rule or the timestamp line, which is held until it is complete.
+
+    Args:
+        pieces: Bulletin text fragments
+
+    Yields:
+        Tuples of (part index, text); rule lines advance the index and are dropped
+    """
+    part = 0
+    held = ""
+    line_start = True
+
+    for piece in pieces:
+        lines = (held + piece).split("\n")
+        held = ""
+        for line in lines[:-1]:
+            if line_start and _RULE_RE.fullmatch(line):
+                part += 1
+            elif not (line_start and line.startswith(_TIMESTAMP_PREFIX)):
+                yield part, line + "\n"
+            line_start = True
+
+        tail = lines[-1]
+        if line_start and _is_unspoken_prefix(tail):
+            held = tail
+        elif tail:
+            yield part, tail
+            line_start = False
+
+    if held and not _RULE_RE.fullmatch(held) and not held.startswith(_TIMESTAMP_PREFIX):
+        yield part, held
+
+
+def iter_bulletin_parts(pieces: Iterable[str]) -> Iterator[Iterator[str]]:
+    """Split a (streamed) bulletin into the parts between its "=" rules.
+
+    The title block, the synthesis and the source list each become a
+    separate part, so segments never straddle them: the unchanging parts
+    produce the same segment text on every run and hit the audio cache.
+    Rule lines and the generation timestamp are dropped, as neither is
+    worth speaking.
+
+    Args:
+        pieces: Bulletin text fragments
+
+    Yields:
+        One iterator of text fragments per part; each must be consumed
+        before advancing to the next
+    """
+    for _, group in groupby(_tag_bulletin_lines(pieces), key=itemgetter(0)):
+        yield (text for _, text in group)
+
+
+# Loaded Coqui models by (model name, device), shared by every TextToSpeech
+# instance in the process, each with a lock serializing its inference
+_MODEL_CACHE: Dict[Tuple[str, str], Tuple[object, threading.Lock]] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _load_coqui_model(model_name: str, device: str) -> Tuple[object, threading.Lock]:
+    """Load a Coqui model once per process and reuse it afterwards.
+
+    Args:
+        model_name: Coqui model name
+        device: Torch device ("cpu" or "cuda")
+
+    Returns:
+        Tuple of (Coqui TTS instance, lock to hold while running it)
+    """
+    with _MODEL_CACHE_LOCK:
+        cached = _MODEL_CACHE.get((model_name, device))
+        if cached is None:
+            from TTS.api import TTS as CoquiTTS
+
+            logger.info(f"Loading Coqui TTS model {model_name} (this may take a moment)...")
+            cached = (CoquiTTS(model_name=model_name).to(device), threading.Lock())
+            _MODEL_CACHE[(model_name, device)] = cached
+            logger.info(f"TTS model loaded on {device}!")
+        else:
+            logger.debug(f"Reusing loaded Coqui TTS model {model_name} ({device})")
+        return cached
+
+
+def _coqui_worker(model_name: str, onnx: bool, fp16: bool, requests, results):
+    """Serve Coqui synthesis requests from a dedicated process.
+
+    Args:
+        model_name: Coqui model name
+        onnx: Use the INT8 ONNX model (see TextToSpeech)
+        fp16: Use half precision on a CUDA GPU (see TextToSpeech)
+        requests: Queue of segment texts, terminated by None
+        results: Queue receiving ("ready", (sample rate, render settings))
+            once, then ("ok", PCM bytes) or ("error", message) per request
+    """
+    try:
+        tts = TextToSpeech(engine="coqui", model_name=model_name, onnx=onnx, fp16=fp16)
+    except Exception as e:
+        results.put(("error", repr(e)))
+        return
+    results.put(("ready", (tts.sample_rate, tts._render_settings)))
+
+    for text in iter(requests.get, None):
+        try:
+            results.put(("ok", b"".join(tts._render_segment(text))))
+        except Exception as e:
+            results.put(("error", repr(e)))
+
+
+class _CoquiProcess:
+    """Handle to a Coqui model running in its own process (see _coqui_worker)."""
+
+    def __init__(self, model_name: str, onnx: bool, fp16: bool):
+        """Start the worker process and wait for the model to load.
+
+        Args:
+            model_name: Coqui model name
+            onnx: Use the INT8 ONNX model
+            fp16: Use half precision on a CUDA GPU
+
+        Raises:
+            RuntimeError: If the model fails to load in the worker
+        """
+        # spawn: forking a process that has threads (or CUDA) running is unsafe
+        context = multiprocessing.get_context("spawn")
+        self.requests = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(
+            target=_coqui_worker,
+            args=(model_name, onnx, fp16, self.requests, self.results),
+            daemon=True
+        )
+        self.lock = threading.Lock()
+
+        logger.info(f"Starting Coqui TTS worker process for {model_name}...")
+        self.process.start()
+        self.sample_rate, self.render_settings = self._result()
+        logger.info(f"Coqui TTS worker ready (pid {self.process.pid})")
+
+    def _result(self):
+        """Wait for the worker's next reply, failing if the worker has died."""
+        while True:
+            try:
+                status, value = self.results.get(timeout=1)
+                break
+            except queue.Empty:
+                if not self.process.is_alive():
+                    raise RuntimeError(f"Coqui worker exited with code {self.process.exitcode}")
+        if status == "error":
+            raise RuntimeError(f"Coqui worker failed: {value}")
+        return value
+
+    def synthesize(self, text: str) -> bytes:
+        """Synthesize one segment in the worker.
+
+        Args:
+            text: Segment text
+
+        Returns:
+            16-bit mono PCM frames
+        """
+        with self.lock:
+            self.requests.put(text)
+            return self._result()
+
+    def close(self):
+        """Ask the worker to exit and wait briefly for it."""
+        if self.process.is_alive():
+            self.requests.put(None)
+            self.process.join(timeout=5)
+
 
 class TextToSpeech:
     """Convert text to speech audio."""
 
-    def __init__(self, engine: str = "coqui", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        engine: str = "coqui",
+        api_key: Optional[str] = None,
+        max_workers: int = 4,
+        cache: Optional[ResponseCache] = None,
+        model_name: Optional[str] = None,
+        onnx: bool = False,
+        fp16: bool = False,
+        process: bool = False
+    ):
         """Initialize TTS engine.
 
         Args:
             engine: TTS engine to use ("coqui" for local, "openai" for OpenAI TTS)
             api_key: API key for OpenAI (if using openai engine)
+            max_workers: Concurrent segment requests for the OpenAI engine (default: 4)
+            cache: Optional persistent cache for synthesized segment audio
+            model_name: TTS model (default: DEFAULT_COQUI_MODEL for Coqui,
+                DEFAULT_OPENAI_TTS_MODEL for OpenAI; "tts-1-hd" for higher quality)
+            onnx: Run the Coqui model through ONNX Runtime with INT8 weights
+                (VITS models only; falls back to PyTorch if unavailable)
+            fp16: Run the Coqui model in half precision when on a CUDA GPU
+            process: Load and run the Coqui model in a separate worker process,
+                so synthesis does not compete with this process for the GIL
         """
         self.engine = engine.lower()
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.voice = None
+        self.onnx_model = None
+        self.fp16 = False
+        self.worker = None
 
         if self.engine == "coqui":
             if not COQUI_AVAILABLE:
                 raise ImportError(
                     "Coqui TTS not installed. Install with: pip install coqui-tts"
                 )
-            logger.info("Loading Coqui TTS model (this may take a moment)...")
-            # Use a high-quality English model
-            self.tts = CoquiTTS(model_name="tts_models/en/ljspeech/tacotron2-DDC")
-            logger.info("TTS model loaded!")
+            if process:
+                self.model_name = model_name or DEFAULT_COQUI_MODEL
+                self.worker = _CoquiProcess(self.model_name, onnx, fp16)
+                weakref.finalize(self, self.worker.close)
+                return
+
+            import torch
+
+            self.model_name = model_name or DEFAULT_COQUI_MODEL
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.tts, self._model_lock = _load_coqui_model(self.model_name, device)
+            self.fp16 = fp16 and device == "cuda"
+
+            # ONNX Runtime only helps on CPU; a GPU is faster still
+            if onnx and device == "cpu":
+                self._load_onnx()
 
         elif self.engine == "openai":
             if not OPENAI_AVAILABLE:
                 raise ImportError(
                     "OpenAI library not installed. Install with: pip install openai"
                 )
+            from openai import OpenAI
+
             self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+            self.model_name = model_name or DEFAULT_OPENAI_TTS_MODEL
             self.voice = "alloy"  # Options: alloy, echo, fable, onyx, nova, shimmer
             logger.info("OpenAI TTS engine initialized")
 
         else:
             raise ValueError(f"Unsupported TTS engine: {engine}")
 
-    def convert(self, text: str, output_path: str) -> str:
+    def _load_onnx(self):
+        """Switch Coqui inference to an INT8-quantized ONNX Runtime session.
+
+        The model is exported and quantized once and reused from ONNX_CACHE_DIR.
+        Any failure leaves the PyTorch model in use.
+        """
+        model = self.tts.synthesizer.tts_model
+        if getattr(model, "onnx_sess", None) is not None:
+            # Already switched by another instance sharing this model
+            self.onnx_model = model
+            return
+        if not ONNX_AVAILABLE:
+            logger.warning("ONNX Runtime not installed; using PyTorch. Install with: pip install onnxruntime onnx")
+            return
+        if not hasattr(model, "export_onnx"):
+            logger.warning(f"{self.model_name} does not support ONNX export; using PyTorch")
+            return
+
+        try:
+            import onnxruntime as ort
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            ONNX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            stem = self.model_name.replace("/", "--")
+            fp32_path = ONNX_CACHE_DIR / f"{stem}.onnx"
+            int8_path = ONNX_CACHE_DIR / f"{stem}.int8.onnx"
+
+            if not int8_path.exists():
+                logger.info(f"Exporting {self.model_name} to ONNX with INT8 weights (one-time)...")
+                model.export_onnx(output_path=str(fp32_path))
+                quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+                fp32_path.unlink(missing_ok=True)
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            model.onnx_sess = ort.InferenceSession(
+                str(int8_path), sess_options=options, providers=["CPUExecutionProvider"]
+            )
+        except Exception as e:
+            logger.warning(f"ONNX export failed, using PyTorch: {e}")
+            return
+
+        self.onnx_model = model
+        logger.info(f"Using INT8 ONNX model: {int8_path}")
+
+    def convert(self, text: Union[str, Iterable[str]], output_path: str) -> str:
         """Convert text to speech and save to file.
 
         Args:
-            text: Text to convert
+            text: Text to convert, or an iterable of text fragments (e.g. a
+                streamed LLM response) to convert as they arrive
+            output_path: Path to save the audio file
+
+        Returns:
+            Path to the saved audio file
+        """
+        logger.info(f"Converting text to speech using {self.engine} engine...")
+        return self._write_audio(self.convert_stream(text), output_path)
+
+    async def convert_async(self, text: Union[str, Iterable[str]], output_path: str) -> str:
+        """Convert text to speech and save to file without blocking the event loop.
+
+        Synthesis and file writes run on worker threads, so an async server
+        keeps serving while the audio is produced. Segments are still
+        synthesized ahead of the write, as in convert.
+
+        Args:
+            text: Text to convert, or an iterable of text fragments
+            output_path: Path to save the audio file
+
+        Returns:
+            Path to the saved audio file
+        """
+        return await asyncio.to_thread(self.convert, text, output_path)
+
+    def convert_stream(self, text: Union[str, Iterable[str]]) -> Iterator[bytes]:
+        """Convert text to speech, yielding audio as soon as it is produced.
+
+        Suitable for piping to a playback device or a chunked HTTP response:
+        OpenAI audio is passed on while the response is still downloading.
+
+        Args:
+            text: Text to convert, or an iterable of text fragments (e.g. a
+                streamed LLM response) to convert as they arrive
+
+        Yields:
+            MP3 data (OpenAI) or 16-bit mono PCM frames at sample_rate (Coqui)
+        """
+        if isinstance(text, str):
+            # Remove whitespace
+            # https://github.com/coqui-ai/TTS/issues/2336
+            text = [text.strip()]
+        yield from self._render_segments(iter_segments(text, self._min_segment_chars), self._workers)
+
+    @property
+    def sample_rate(self) -> Optional[int]:
+        """Sample rate of Coqui PCM output (None for the OpenAI engine)."""
+        if self.engine != "coqui":
+            return None
+        if self.worker is not None:
+            return self.worker.sample_rate
+        return self.tts.synthesizer.output_sample_rate
+
+    @property
+    def _render_settings(self) -> tuple:
+        """Settings besides the model and voice that change the rendered audio.
+
+        Coqui output depends on whether the INT8 ONNX session or FP16 is in
+        use, as actually loaded (which may differ from what was requested).
+        """
+        if self.engine != "coqui":
+            return ()
+        if self.worker is not None:
+            return self.worker.render_settings
+        return (self.onnx_model is not None, self.fp16, self.sample_rate)
+
+    @property
+    def _min_segment_chars(self) -> int:
+        """Minimum segment length for the current engine."""
+        return COQUI_MIN_SEGMENT_CHARS if self.engine == "coqui" else OPENAI_MIN_SEGMENT_CHARS
+
+    @property
+    def _workers(self) -> int:
+        """Segments synthesized at the same time (Coqui models are not thread-safe)."""
+        return 1 if self.engine == "coqui" else self.max_workers
+
+    def convert_chunks(self, chunks: Iterable[str], output_path: str) -> str:
+        """Convert streamed text to speech as it arrives and save to one file.
+
+        Fragments are grouped into sentence-bounded segments, and each segment
+        is synthesized as soon as it is complete, so audio generation overlaps
+        with whatever produces the text.
+
+        Args:
+            chunks: Text fragments, e.g. tokens streamed from an LLM
+            output_path: Path to save the audio file
+
+        Returns:
+            Path to the saved audio file
+        """
+        logger.info(f"Converting streamed text to speech using {self.engine} engine...")
+        return self._write_audio(self.convert_stream(chunks), output_path)
+
+    def convert_parallel(self, segments: Iterable[str], output_path: str) -> str:
+        """Synthesize text segments concurrently and join them in order into one file.
+
+        OpenAI segments are requested through a pool of max_workers threads.
+        Coqui segments run one at a time, because the model is not thread-safe,
+        but the next segment is synthesized while the current one is written.
+        Audio is written in submission order as soon as every earlier segment
+        is done.
+
+        Args:
+            segments: Text segments, each synthesized as one request
+            output_path: Path to save the audio file
+
+        Returns:
+            Path to the saved audio file
+        """
+        return self._write_audio(self._render_segments(segments, self._workers), output_path)
+
+    def _write_audio(self, audio: Iterable[bytes], output_path: str) -> str:
+        """Write audio produced by convert_stream to a file.
+
+        Args:
+            audio: MP3 data (OpenAI) or PCM frames (Coqui)
             output_path: Path to save the audio file
 
         Returns:
             Path to the saved audio file
         """
-        # Remove whitespace
-        # https://github.com/coqui-ai/TTS/issues/2336
-        text = str(text).strip()
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Converting text to speech using {self.engine} engine...")
+        # Write to a temporary file and move it into place only once complete,
+        # so a failed or interrupted run never replaces an existing bulletin
+        tmp_name = str(output_path.with_name(f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"))
+        try:
+            if self.engine == "coqui":
+                with wave.open(tmp_name, "wb") as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(2)
+                    wav_file.setframerate(self.sample_rate)
+                    for frames in audio:
+                        wav_file.writeframes(frames)
 
-        if self.engine == "coqui":
-            # Coqui TTS with Tacotron2 requires minimum text length
-            # Ensure text is long enough to avoid kernel size errors
-            min_chars = 50
-            if len(text) < min_chars:
-                logger.warning(f"Text too short for TTS ({len(text)} chars). Minimum {min_chars} required.")
-                raise ValueError(
-                    f"Text must be at least {min_chars} characters long for Coqui TTS. "
-                    f"Got {len(text)} characters. Consider using OpenAI TTS instead or adding more content."
+            elif self.engine == "openai":
+                # MP3 streams can be concatenated frame by frame
+                with open(tmp_name, "wb") as audio_file:
+                    for data in audio:
+                        audio_file.write(data)
+
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Audio saved to: {output_path}")
+        return str(output_path)
+
+    def _render_segments(self, segments: Iterable[str], workers: int) -> Iterator[bytes]:
+        """Synthesize segments on a thread pool, yielding their audio in input order.
+
+        Args:
+            segments: Text segments to synthesize
+            workers: Number of segments synthesized at the same time
+
+        Yields:
+            Audio chunks, in the order the segments were given; chunks of the
+            first unfinished segment are passed on as they arrive
+
+        At most workers + 1 segments are outstanding, so one segment is always
+        queued ahead of the pool (one-ahead prefetch with a single worker)
+        while the caller writes out the previous result.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for i, segment in enumerate(segments, 1):
+                logger.debug(f"Synthesizing segment {i} ({len(segment)} chars)")
+                chunks = queue.Queue()
+                in_flight.append((pool.submit(self._synthesize_segment, segment, chunks), chunks))
+
+                # Pass on whatever audio is ready, and block once one segment
+                # is queued beyond the busy workers
+                while in_flight:
+                    remaining = len(in_flight)
+                    yield from self._drain_head(in_flight, block=remaining > workers)
+                    if len(in_flight) == remaining:
+                        break
+
+            while in_flight:
+                yield from self._drain_head(in_flight, block=True)
+
+    @staticmethod
+    def _drain_head(in_flight: deque, block: bool) -> Iterator[bytes]:
+        """Yield the audio of the first in-flight segment, removing it once complete.
+
+        Args:
+            in_flight: Deque of (future, chunk queue) pairs in segment order
+            block: Wait for the head segment to finish rather than returning
+                once its queued chunks are exhausted
+        """
+        future, chunks = in_flight[0]
+        while True:
+            try:
+                chunk = chunks.get(block=block)
+            except queue.Empty:
+                return
+            if chunk is None:
+                in_flight.popleft()
+                future.result()  # re-raise any synthesis error
+                return
+            yield chunk
+
+    def _synthesize_segment(self, text: str, chunks: queue.Queue):
+        """Synthesize one segment into a queue, reusing cached audio when available.
+
+        Args:
+            text: Segment text
+            chunks: Queue receiving the audio chunks, followed by None
+        """
+        try:
+            cache_key = None
+            if self.cache is not None:
+                cache_key = make_key(
+                    "tts", self.engine, self.model_name, self.voice, self._render_settings, text
                 )
+                audio = self.cache.get(cache_key)
+                if audio is not None:
+                    logger.debug(f"Using cached audio for segment ({len(text)} chars)")
+                    chunks.put(audio)
+                    return
 
-            # Coqui TTS saves directly to file
-            self.tts.tts_to_file(text=text, file_path=str(output_path))
+            pieces = []
+            for chunk in self._render_segment(text):
+                pieces.append(chunk)
+                chunks.put(chunk)
+            if cache_key is not None:
+                self.cache.set(cache_key, b"".join(pieces))
+        finally:
+            chunks.put(None)
 
-        elif self.engine == "openai":
-            # OpenAI TTS returns audio data that we write to file
-            response = self.client.audio.speech.with_streaming_response.create(
-                model="tts-1-hd",  # or "tts-1" for faster/cheaper
-                voice=self.voice,
-                input=text
+    def _check_coqui_length(self, text: str):
+        """Raise ValueError if text is too short for a Tacotron2 Coqui model."""
+        if "tacotron" in self.model_name.lower() and len(text) < TACOTRON_MIN_CHARS:
+            raise ValueError(
+                f"Text must be at least {TACOTRON_MIN_CHARS} characters long for {self.model_name}. "
+                f"Got {len(text)} characters. Use a VITS model (the default) or OpenAI TTS instead."
             )
 
-            # Write the audio data to file
-            response.stream_to_file(str(output_path))
+    def _render_segment(self, text: str) -> Iterator[bytes]:
+        """Run the TTS engine on one segment of text.
 
-        logger.info(f"Audio saved to: {output_path}")
-        return str(output_path)
+        Args:
+            text: Segment text
+
+        Yields:
+            16-bit mono PCM frames (Coqui) or MP3 data (OpenAI), as produced
+        """
+        if self.worker is not None:
+            yield self.worker.synthesize(text)
+            return
+
+        if self.engine == "coqui":
+            import numpy as np
+
+            self._check_coqui_length(text)
+            with self._model_lock:
+                if self.onnx_model is not None:
+                    ids = self.onnx_model.tokenizer.text_to_ids(text)
+                    wav = self.onnx_model.inference_onnx(np.asarray([ids], dtype=np.int64))
+                elif self.fp16:
+                    import torch
+
+                    with torch.autocast("cuda", dtype=torch.float16):
+                        wav = self.tts.tts(text=text)
+                else:
+                    wav = self.tts.tts(text=text)
+            samples = np.clip(np.asarray(wav, dtype=np.float32).reshape(-1), -1, 1)
+
+            fade = min(len(samples) // 2, int(self.sample_rate * SEGMENT_FADE_SECONDS))
+            if fade:
+                ramp = np.linspace(0.0, 1.0, fade, dtype=np.float32)
+                samples[:fade] *= ramp
+                samples[-fade:] *= ramp[::-1]
+
+            yield (samples * 32767).astype(np.int16).tobytes()
+            return
+
+        # openai
+        with self.client.audio.speech.with_streaming_response.create(
+            model=self.model_name,
+            voice=self.voice,
+            input=text
+        ) as response:
+            yield from response.iter_bytes(chunk_size=4096)
 
     def convert_bulletin(
         self,
-        bulletin_text: str,
+        bulletin_text: Union[str, Iterable[str]],
         output_dir: str = "./output",
         filename: Optional[str] = None
     ) -> str:
         """Convert a bulletin to speech.
 
+        The header, synthesis and source list are segmented separately (see
+        iter_bulletin_parts), so only the synthesis misses the segment audio
+        cache when a bulletin is regenerated.
+
         Args:
-            bulletin_text: The bulletin text to convert
+            bulletin_text: The bulletin text to convert, or an iterable of text
+                fragments to convert as they arrive
             output_dir: Directory to save the audio file
             filename: Optional filename (default: bulletin_YYYY-MM-DD.wav)
 
@@ -124,7 +769,15 @@ class TextToSpeech:
             filename = f"bulletin_{date_str}.{ext}"
 
         output_path = os.path.join(output_dir, filename)
-        return self.convert(bulletin_text, output_path)
+
+        if isinstance(bulletin_text, str):
+            bulletin_text = [bulletin_text]
+        segments = chain.from_iterable(
+            iter_segments(part, self._min_segment_chars) for part in iter_bulletin_parts(bulletin_text)
+        )
+
+        logger.info(f"Converting bulletin to speech using {self.engine} engine...")
+        return self._write_audio(self._render_segments(segments, self._workers), output_path)
 
 
 def get_available_engines() -> list: